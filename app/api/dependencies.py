@@ -1,6 +1,6 @@
 """Dependency injection for API endpoints."""
 
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 from app.core.config import settings
@@ -35,19 +35,35 @@ def get_indexing_service() -> Optional[IndexingService]:
     return _indexing_service
 
 
+@lru_cache(maxsize=1)
+def get_superwhisper_repository() -> SuperwhisperRepository:
+    """
+    Get the shared Superwhisper repository instance.
+
+    Indexing and request handling share one repository, so audio paths
+    resolved while indexing are reused by the audio endpoint.
+
+    Returns:
+        SuperwhisperRepository instance
+    """
+    return SuperwhisperRepository(
+        base_directory=settings.superwhisper_path,
+        scan_concurrency=settings.scan_concurrency,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_transcription_service() -> TranscriptionService:
     """
     Get transcription service instance.
 
+    The service (and its repository) is built once and reused across
+    requests instead of being reconstructed for every call.
+
     Returns:
         TranscriptionService instance
     """
-    # Initialize repository with configured directory
-    repository = SuperwhisperRepository(
-        base_directory=Path(settings.superwhisper_directory)
-    )
-
-    # Initialize service
-    service = TranscriptionService(repository=repository)
+    # Initialize service with the shared repository
+    service = TranscriptionService(repository=get_superwhisper_repository())
 
     return service
@@ -1,21 +1,28 @@
 """API endpoints for conversations."""
 
+import hashlib
 import logging
 import math
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import aiofiles.os
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import FileResponse, Response
 
 from app.api.dependencies import get_indexing_service, get_transcription_service
+from app.models.transcription import AudioVersion
 from app.schemas.transcription import (
+    AudioVersionSchema,
     ConversationListItemSchema,
     ConversationSchema,
     PaginatedConversationListResponse,
     PaginatedSearchResultResponse,
     PaginationMetadata,
     SearchResultSchema,
+    TimecodeEntry,
+    TranscriptionMetadataSchema,
 )
 from app.services.transcription_service import TranscriptionService
 
@@ -23,15 +30,185 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Keys every normalized timecode segment carries
+TIMECODE_KEYS = frozenset(TimecodeEntry.__annotations__)
 
-@router.get("/conversations", response_model=PaginatedConversationListResponse)
+
+def _normalize_timecodes(
+    timecodes: list[dict[str, str | float]] | None,
+) -> list[TimecodeEntry]:
+    """
+    Get timecode entries for a transcription without copying when possible.
+
+    Segments normalized by the repository already have the entry shape and
+    are passed through unchanged; anything else is remapped once.
+
+    Args:
+        timecodes: Segments with start_time, end_time and text
+
+    Returns:
+        List of timecode entries
+    """
+    if not timecodes:
+        return []
+    if isinstance(timecodes[0], dict) and timecodes[0].keys() >= TIMECODE_KEYS:
+        return timecodes  # type: ignore[return-value]
+    return [
+        TimecodeEntry(
+            start_time=tc.get("start_time", 0),
+            end_time=tc.get("end_time", 0),
+            text=tc.get("text", ""),
+        )
+        for tc in timecodes
+    ]
+
+
+def _json_response(schema: object, headers: dict[str, str] | None = None) -> Response:
+    """
+    Serialize a response schema directly to JSON.
+
+    Response schemas are dataclasses built from trusted, already indexed data,
+    so routes return them pre-serialized with orjson instead of letting FastAPI
+    validate and encode them against ``response_model``.
+
+    Args:
+        schema: Response schema to serialize
+        headers: Optional extra response headers
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=orjson.dumps(schema), media_type="application/json", headers=headers
+    )
+
+
+def _build_pagination(
+    page: int,
+    page_size: int,
+    total: int,
+    next_cursor: str | None = None,
+    after_cursor: bool = False,
+) -> PaginationMetadata:
+    """
+    Build pagination metadata for a page of results.
+
+    Pages fetched by cursor have no reliable page number, so their
+    neighbours are derived from the cursors instead: a next page exists when
+    next_cursor is set, and a previous one always does.
+
+    Args:
+        page: Current page number (1-indexed)
+        page_size: Number of items per page
+        total: Total number of items
+        next_cursor: Optional cursor of the next page
+        after_cursor: Whether the page was fetched with a cursor
+
+    Returns:
+        Pagination metadata
+    """
+    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    if after_cursor:
+        has_next, has_prev = next_cursor is not None, True
+    else:
+        has_next, has_prev = page < total_pages, page > 1
+    return PaginationMetadata(
+        page=page,
+        page_size=page_size,
+        total_items=total,
+        total_pages=total_pages,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
+    )
+
+
+def _parse_cursor(cursor: str) -> tuple[int, str]:
+    """
+    Parse a conversation list cursor.
+
+    Args:
+        cursor: Cursor in "timestamp:conversation_id" form
+
+    Returns:
+        Tuple of (timestamp, conversation_id)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    timestamp, _, conversation_id = cursor.partition(":")
+    if not timestamp.isdigit() or not conversation_id:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return int(timestamp), conversation_id
+
+
+def _build_version_schema(
+    version: AudioVersion, segments: list[dict[str, str | float]] | None
+) -> AudioVersionSchema:
+    """
+    Convert a domain audio version into its API schema.
+
+    Args:
+        version: Audio version to convert
+        segments: Timecode segments of the version's transcription
+
+    Returns:
+        Audio version schema
+    """
+    transcription = version.transcription
+    return AudioVersionSchema(
+        version_id=version.version_id,
+        timestamp=version.timestamp,
+        transcription=TranscriptionMetadataSchema(
+            timestamp=transcription.timestamp,
+            directory=str(transcription.directory),
+            audio_file=str(transcription.audio_file) if transcription.audio_file else None,
+            raw_transcription=transcription.transcription_text,
+            transcription_with_timecodes=_normalize_timecodes(segments),
+            llm_output=transcription.llm_output,
+            duration=transcription.duration,
+            created_at=transcription.created_at,
+        ),
+        is_latest=version.is_latest,
+    )
+
+
+def _etag(body: bytes) -> str:
+    """
+    Build a strong ETag for a response body.
+
+    Conversations can change without a new version (a recording re-processed
+    in place rewrites its meta.json), so the tag is derived from the content
+    itself rather than from timestamps or version counts.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        ETag value
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@router.get(
+    "/conversations",
+    response_model=None,
+    responses={200: {"model": PaginatedConversationListResponse}},
+)
 async def list_conversations(
     service: Annotated[TranscriptionService, Depends(get_transcription_service)],
     page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 30,
-    start_timestamp: Annotated[int | None, Query(description="Start timestamp filter (Unix timestamp)")] = None,
-    end_timestamp: Annotated[int | None, Query(description="End timestamp filter (Unix timestamp)")] = None,
-) -> PaginatedConversationListResponse:
+    start_timestamp: Annotated[
+        int | None, Query(description="Start timestamp filter (Unix timestamp)")
+    ] = None,
+    end_timestamp: Annotated[
+        int | None, Query(description="End timestamp filter (Unix timestamp)")
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description="Cursor from pagination.next_cursor; replaces page")
+    ] = None,
+) -> Response:
     """
     Get paginated list of conversations.
 
@@ -40,10 +217,13 @@ async def list_conversations(
         page_size: Number of items per page (max 100)
         start_timestamp: Optional start timestamp filter (Unix timestamp)
         end_timestamp: Optional end timestamp filter (Unix timestamp)
+        cursor: Optional cursor of the page to fetch, for constant-cost deep pages
 
     Returns:
         Paginated list of conversation summaries
     """
+    before = _parse_cursor(cursor) if cursor else None
+
     # Ensure index is synchronized with file system
     indexing_service = get_indexing_service()
     if indexing_service:
@@ -61,16 +241,24 @@ async def list_conversations(
         page_size=page_size,
         start_timestamp=start_timestamp,
         end_timestamp=end_timestamp,
+        before=before,
+        lookahead=1,
     )
 
+    # The row past the page only tells whether a next page exists
+    next_cursor = None
+    if len(results) > page_size:
+        results = results[:page_size]
+        last = results[-1]
+        next_cursor = f"{last['timestamp']}:{last['conversation_id']}"
+
     # Convert to schema
     items = []
     for row in results:
         # Use created_at if available, otherwise convert timestamp to datetime
-        created_at = None
-        if row.get("created_at"):
-            created_at = datetime.fromisoformat(row["created_at"])
-        elif row.get("timestamp"):
+        # (TIMESTAMP columns are already returned as datetime by the driver)
+        created_at = row["created_at"]
+        if created_at is None and row["timestamp"]:
             # Convert Unix timestamp to datetime
             created_at = datetime.fromtimestamp(row["timestamp"])
 
@@ -79,35 +267,39 @@ async def list_conversations(
                 conversation_id=row["conversation_id"],
                 title=row["title"],
                 latest_timestamp=row["timestamp"],
-                version_count=1,  # We only store latest in index, need to count if needed
+                version_count=row["version_count"],
                 created_at=created_at,
                 updated_at=created_at,  # Use same as created_at for display
             )
         )
 
-    # Calculate pagination metadata
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
-    pagination = PaginationMetadata(
-        page=page,
-        page_size=page_size,
-        total_items=total,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1,
+    return _json_response(
+        PaginatedConversationListResponse(
+            items=items,
+            pagination=_build_pagination(
+                page, page_size, total, next_cursor, after_cursor=before is not None
+            ),
+        )
     )
 
-    return PaginatedConversationListResponse(items=items, pagination=pagination)
-
 
-@router.get("/conversations/search", response_model=PaginatedSearchResultResponse)
+@router.get(
+    "/conversations/search",
+    response_model=None,
+    responses={200: {"model": PaginatedSearchResultResponse}},
+)
 async def search_conversations(
     q: Annotated[str, Query(min_length=1, description="Search query")],
     service: Annotated[TranscriptionService, Depends(get_transcription_service)],
     page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 30,
-    start_timestamp: Annotated[int | None, Query(description="Start timestamp filter (Unix timestamp)")] = None,
-    end_timestamp: Annotated[int | None, Query(description="End timestamp filter (Unix timestamp)")] = None,
-) -> PaginatedSearchResultResponse:
+    start_timestamp: Annotated[
+        int | None, Query(description="Start timestamp filter (Unix timestamp)")
+    ] = None,
+    end_timestamp: Annotated[
+        int | None, Query(description="End timestamp filter (Unix timestamp)")
+    ] = None,
+) -> Response:
     """
     Search for conversations matching a query with pagination.
 
@@ -123,6 +315,15 @@ async def search_conversations(
     Returns:
         Paginated search results with matching snippets
     """
+    # Validate the query once; blank queries cannot match, so skip the index
+    query = q.strip()
+    if not query:
+        return _json_response(
+            PaginatedSearchResultResponse(
+                items=[], pagination=_build_pagination(page, page_size, 0)
+            )
+        )
+
     # Ensure index is synchronized with file system
     indexing_service = get_indexing_service()
     if indexing_service:
@@ -136,7 +337,7 @@ async def search_conversations(
 
     # Use the new FTS5-based search with pagination
     results, total = await service.search_conversations_paginated(
-        query=q,
+        query=query,
         page=page,
         page_size=page_size,
         start_timestamp=start_timestamp,
@@ -145,44 +346,43 @@ async def search_conversations(
 
     # Convert to schema
     items = []
-    for row in results:
+    for result in results:
         items.append(
             SearchResultSchema(
-                conversation_id=row["conversation_id"],
-                title=row["title"],
-                matches=row.get("match_snippets", []),
-                latest_timestamp=row["timestamp"],
-                version_count=1,  # We only store latest in index
+                conversation_id=result.conversation_id,
+                title=result.title,
+                matches=result.match_snippets,
+                latest_timestamp=result.timestamp,
+                version_count=result.version_count,
             )
         )
 
-    # Calculate pagination metadata
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
-    pagination = PaginationMetadata(
-        page=page,
-        page_size=page_size,
-        total_items=total,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1,
+    return _json_response(
+        PaginatedSearchResultResponse(
+            items=items, pagination=_build_pagination(page, page_size, total)
+        )
     )
 
-    return PaginatedSearchResultResponse(items=items, pagination=pagination)
 
-
-@router.get("/conversations/{conversation_id}", response_model=ConversationSchema)
+@router.get(
+    "/conversations/{conversation_id}",
+    response_model=None,
+    responses={200: {"model": ConversationSchema}},
+)
 async def get_conversation(
     conversation_id: str,
     service: Annotated[TranscriptionService, Depends(get_transcription_service)],
-) -> ConversationSchema:
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
     """
     Get detailed information about a specific conversation.
 
     Args:
         conversation_id: Conversation identifier
+        if_none_match: Optional ETags the client already has cached
 
     Returns:
-        Conversation details with all versions
+        Conversation details with all versions, or 304 if the client's copy is current
     """
     # Ensure index is synchronized with file system
     indexing_service = get_indexing_service()
@@ -198,74 +398,43 @@ async def get_conversation(
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Convert to schema
-    from app.schemas.transcription import AudioVersionSchema, TranscriptionMetadataSchema
-
+    # Convert to schema, reusing the latest version's schema when it is listed
+    segments = await service.get_segments([v.transcription for v in conversation.versions])
     versions = [
-        AudioVersionSchema(
-            version_id=v.version_id,
-            timestamp=v.timestamp,
-            transcription=TranscriptionMetadataSchema(
-                timestamp=v.transcription.timestamp,
-                directory=str(v.transcription.directory),
-                audio_file=str(v.transcription.audio_file)
-                if v.transcription.audio_file
-                else None,
-                raw_transcription=v.transcription.transcription_text,
-                transcription_with_timecodes=[
-                    {
-                        "start_time": tc.get("start_time", 0),
-                        "end_time": tc.get("end_time", 0),
-                        "text": tc.get("text", ""),
-                    }
-                    for tc in (v.transcription.transcription_with_timecodes or [])
-                ],
-                llm_output=v.transcription.llm_output,
-                duration=v.transcription.duration,
-                created_at=v.transcription.created_at,
-            ),
-            is_latest=v.is_latest,
-        )
-        for v in conversation.versions
+        _build_version_schema(v, v_segments)
+        for v, v_segments in zip(conversation.versions, segments)
     ]
 
     latest_version = None
     if conversation.latest_version:
-        v = conversation.latest_version
-        latest_version = AudioVersionSchema(
-            version_id=v.version_id,
-            timestamp=v.timestamp,
-            transcription=TranscriptionMetadataSchema(
-                timestamp=v.transcription.timestamp,
-                directory=str(v.transcription.directory),
-                audio_file=str(v.transcription.audio_file)
-                if v.transcription.audio_file
-                else None,
-                raw_transcription=v.transcription.transcription_text,
-                transcription_with_timecodes=[
-                    {
-                        "start_time": tc.get("start_time", 0),
-                        "end_time": tc.get("end_time", 0),
-                        "text": tc.get("text", ""),
-                    }
-                    for tc in (v.transcription.transcription_with_timecodes or [])
-                ],
-                llm_output=v.transcription.llm_output,
-                duration=v.transcription.duration,
-                created_at=v.transcription.created_at,
-            ),
-            is_latest=v.is_latest,
+        latest = conversation.latest_version
+        latest_version = next(
+            (schema for v, schema in zip(conversation.versions, versions) if v is latest),
+            None,
+        )
+        if latest_version is None:
+            (latest_segments,) = await service.get_segments([latest.transcription])
+            latest_version = _build_version_schema(latest, latest_segments)
+
+    body = orjson.dumps(
+        ConversationSchema(
+            conversation_id=conversation.conversation_id,
+            title=conversation.title,
+            versions=versions,
+            latest_version=latest_version,
+            created_at=conversation.created_at,
+            updated_at=conversation.updated_at,
         )
-
-    return ConversationSchema(
-        conversation_id=conversation.conversation_id,
-        title=conversation.title,
-        versions=versions,
-        latest_version=latest_version,
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at,
     )
 
+    # Skip sending the payload when the client's copy is current
+    etag = _etag(body)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/conversations/{conversation_id}/audio/{version_id}")
 async def get_audio_file(
@@ -276,6 +445,10 @@ async def get_audio_file(
     """
     Get audio file for a specific conversation version.
 
+    The file is served straight from disk by ``FileResponse``, which streams
+    it in chunks (or hands the path to the server when it supports that) and
+    answers ``Range`` requests sent by the audio element when seeking.
+
     Args:
         conversation_id: Conversation identifier
         version_id: Version identifier (timestamp)
@@ -285,11 +458,13 @@ async def get_audio_file(
     """
     try:
         audio_file_path = await service.get_audio_file_path(conversation_id, version_id)
+        stat_result = await aiofiles.os.stat(audio_file_path)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
     return FileResponse(
-        path=audio_file_path,
+        audio_file_path,
         media_type="audio/wav",
         filename=f"audio_{version_id}.wav",
+        stat_result=stat_result,
     )
@@ -1,5 +1,8 @@
 """Application configuration."""
 
+from functools import cached_property
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -31,8 +34,18 @@ class Settings(BaseSettings):
     cors_allow_methods: list[str] = ["*"]
     cors_allow_headers: list[str] = ["*"]
 
+    # Static files
+    static_cache_max_age: int = 300  # Seconds browsers may reuse the SPA shell and assets
+
     # Transcription Provider Settings
     superwhisper_directory: str = "./data/superwhisper"
+    # Directories loaded concurrently while scanning; SSDs handle 32-64, HDDs 4-8
+    scan_concurrency: int = 32
+
+    @cached_property
+    def superwhisper_path(self) -> Path:
+        """Superwhisper directory as a Path, built once."""
+        return Path(self.superwhisper_directory)
 
 
 settings = Settings()
@@ -1,5 +1,25 @@
 """Database module for SQLite operations."""
 
-from app.db.database import get_db, init_db
+from app.db.database import (
+    clear_index,
+    close_db,
+    get_db,
+    init_db,
+    maybe_analyze,
+    rebuild_fts,
+    suspend_fts_sync,
+    to_epoch_seconds,
+    transaction,
+)
 
-__all__ = ["get_db", "init_db"]
+__all__ = [
+    "clear_index",
+    "close_db",
+    "get_db",
+    "init_db",
+    "maybe_analyze",
+    "rebuild_fts",
+    "suspend_fts_sync",
+    "to_epoch_seconds",
+    "transaction",
+]
@@ -1,6 +1,11 @@
 """SQLite database connection and initialization."""
 
+import calendar
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -8,31 +13,273 @@ from typing import Optional
 # Go up from app/db/database.py to project root
 DB_PATH = Path(__file__).parent.parent.parent / "transcription_cache.db"
 
+# Applied once when the shared connection is opened; page_size only takes
+# effect on a fresh database, so it must precede the WAL switch
+CONNECTION_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Prepared statements kept per connection; the default of 100 is exceeded by
+# the per-filter and per-batch-size statement variants of the repositories
+CACHED_STATEMENTS = 256
+
+# Process-wide connection shared by all repositories
+_connection: Optional[sqlite3.Connection] = None
+_connection_lock = threading.Lock()
+# Set by close_db() and cleared by init_db(), so nothing reopens the
+# connection behind a shutdown
+_closed = False
+
+# Serializes write transactions on the shared connection
+_write_lock = threading.RLock()
+
+# Re-run ANALYZE once the index grows past this multiple of the analyzed size
+ANALYZE_GROWTH_FACTOR = 1.25
+
+# Triggers mirroring transcription_index writes into transcription_fts
+FTS_TRIGGERS = (
+    "transcription_index_ai",
+    "transcription_index_ad",
+    "transcription_index_au",
+)
+
+
+# Origin of the integer TIMESTAMP encoding; values are naive wall-clock times
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(value: datetime) -> int:
+    """
+    Encode a datetime for storage in an integer TIMESTAMP column.
+
+    Naive datetimes are encoded as wall-clock seconds since 1970-01-01, so
+    they read back unchanged regardless of the server's timezone; aware
+    datetimes are stored as UTC. Sub-second precision is truncated, so
+    microseconds do not survive a round trip; ISO 8601 values written before
+    this encoding keep theirs, as the TIMESTAMP converter decodes both.
+
+    Args:
+        value: Datetime to encode
+
+    Returns:
+        Seconds since the epoch
+    """
+    return calendar.timegm(value.utctimetuple())
+
+
+def _convert_timestamp(value: bytes) -> datetime:
+    """
+    Convert a stored TIMESTAMP column value into a datetime.
+
+    Handles integers written by to_epoch_seconds, ISO 8601 values written by
+    the repositories and SQLite's CURRENT_TIMESTAMP format.
+
+    Args:
+        value: Raw column value
+
+    Returns:
+        Parsed (naive) datetime
+    """
+    if value.lstrip(b"-").isdigit():
+        return _EPOCH + timedelta(seconds=int(value))
+    return datetime.fromisoformat(value.decode())
+
+
+# Let the driver return TIMESTAMP columns as datetime objects
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
 
 def get_db() -> sqlite3.Connection:
     """
-    Get or create a SQLite database connection.
+    Get the shared SQLite database connection.
+
+    The connection is opened lazily on first use and reused for the lifetime
+    of the process, so callers must not close it.
 
     Returns:
         SQLite connection object
+
+    Raises:
+        RuntimeError: If close_db() was called and init_db() has not run since
     """
-    conn = sqlite3.connect(str(DB_PATH))
+    global _connection
+    if _connection is None:
+        with _connection_lock:
+            if _connection is None:
+                if _closed:
+                    raise RuntimeError("Database connection is closed")
+                _connection = _connect()
+    return _connection
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open a new SQLite connection with tuned pragmas.
+
+    Returns:
+        SQLite connection object
+    """
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        check_same_thread=False,
+        # Autocommit; transaction() issues BEGIN/COMMIT explicitly
+        isolation_level=None,
+        cached_statements=CACHED_STATEMENTS,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+    )
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+@contextmanager
+def transaction() -> Iterator[sqlite3.Cursor]:
+    """
+    Run a write transaction on the shared connection.
+
+    Writers are serialized on a lock; the transaction is committed when the
+    block exits normally and rolled back if it raises. BEGIN IMMEDIATE takes
+    the database write lock up front, so a writer in another process makes
+    it wait out the busy timeout at BEGIN instead of failing with SQLITE_BUSY
+    when a deferred transaction tries to upgrade its read lock mid-way.
+
+    Yields:
+        Cursor bound to the shared connection
+    """
+    conn = get_db()
+    with _write_lock:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+
+
+def close_db() -> None:
+    """
+    Close the shared SQLite connection if it is open.
+
+    Closing the last connection checkpoints the WAL into the database file.
+    Until init_db() runs again, get_db() raises instead of opening a new
+    connection, so a late writer can't leave a fresh WAL behind.
+    """
+    global _connection, _closed
+    with _connection_lock:
+        _closed = True
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
 def init_db() -> None:
     """
     Initialize the database with required tables.
 
     Creates tables if they don't exist:
     - superwhisper_cache: Maps SuperWhisper recording IDs to internal IDs
+    - audio_hash_cache: Audio file hashes keyed by path, size and mtime
     - transcription_index: Stores transcription metadata for fast querying
     - transcription_fts: FTS5 virtual table for full-text search
+
+    Also reopens the shared connection after close_db().
+    """
+    global _closed
+    with _connection_lock:
+        _closed = False
+
+    with transaction() as cursor:
+        # Sync triggers missing from an existing FTS table mean a bulk load
+        # was interrupted before rebuild_fts() ran, leaving rows unsearchable
+        interrupted_bulk_load = _fts_sync_suspended(cursor)
+        _create_schema(cursor)
+        if interrupted_bulk_load:
+            cursor.execute("INSERT INTO transcription_fts(transcription_fts) VALUES('rebuild')")
+
+    # Cheap when statistics are current; refreshes them when the planner needs it
+    get_db().execute("PRAGMA optimize")
+
+
+def maybe_analyze() -> bool:
+    """
+    Refresh query planner statistics if they are missing or stale.
+
+    Statistics are considered stale once transcription_index has grown past
+    ANALYZE_GROWTH_FACTOR times the row count recorded by the last ANALYZE.
+
+    Returns:
+        True if ANALYZE was run, False otherwise
     """
     conn = get_db()
-    cursor = conn.cursor()
 
+    try:
+        row = conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = 'transcription_index' LIMIT 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # sqlite_stat1 does not exist until the first ANALYZE
+        row = None
+
+    row_count = conn.execute("SELECT COUNT(*) FROM transcription_index").fetchone()[0]
+    if row_count == 0:
+        return False
+
+    if row is not None:
+        analyzed_count = int(row["stat"].split()[0])
+        if row_count <= analyzed_count * ANALYZE_GROWTH_FACTOR:
+            return False
+
+    with transaction() as cursor:
+        cursor.execute("ANALYZE")
+    return True
+
+
+def _fts_sync_suspended(cursor: sqlite3.Cursor) -> bool:
+    """
+    Check whether transcription_fts exists without its sync triggers.
+
+    suspend_fts_sync() drops the triggers and rebuild_fts() restores them, so
+    this is only the case while a bulk load is running or after one died.
+
+    Args:
+        cursor: Cursor to query the schema with
+
+    Returns:
+        True if the FTS table exists but any of FTS_TRIGGERS is missing
+    """
+    cursor.execute(
+        f"""
+        SELECT
+            EXISTS (
+                SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transcription_fts'
+            ),
+            (
+                SELECT COUNT(*) FROM sqlite_master
+                WHERE type = 'trigger' AND name IN ({", ".join(["?"] * len(FTS_TRIGGERS))})
+            )
+        """,
+        FTS_TRIGGERS,
+    )
+    fts_exists, trigger_count = cursor.fetchone()
+    return bool(fts_exists) and trigger_count < len(FTS_TRIGGERS)
+
+
+def _create_schema(cursor: sqlite3.Cursor) -> None:
+    """
+    Create tables, indexes and triggers if they don't exist.
+
+    Args:
+        cursor: Cursor to execute the schema statements with
+    """
     # Create superwhisper_cache table
     cursor.execute(
         """
@@ -63,6 +310,18 @@ def init_db() -> None:
         """
     )
 
+    # Create audio_hash_cache table so unchanged audio files are not re-hashed
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audio_hash_cache (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            audio_hash TEXT NOT NULL
+        )
+        """
+    )
+
     # Create transcription_index table for metadata
     cursor.execute(
         """
@@ -88,11 +347,14 @@ def init_db() -> None:
         """
     )
 
-    # Create indexes for common queries
+    # Create indexes for common queries. Conversation lookups are ordered by
+    # timestamp, so the newest version of a conversation is a single seek; this
+    # supersedes the old conversation_id-only index
+    cursor.execute("DROP INDEX IF EXISTS idx_transcription_conversation_id")
     cursor.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_transcription_conversation_id
-        ON transcription_index(conversation_id)
+        CREATE INDEX IF NOT EXISTS idx_transcription_conversation_timestamp
+        ON transcription_index(conversation_id, timestamp DESC)
         """
     )
 
@@ -110,10 +372,17 @@ def init_db() -> None:
         """
     )
 
+    # Create a covering index serving the latest-conversation list in order,
+    # including keyset seeks on (timestamp, conversation_id). SQLite has no
+    # INCLUDE clause, so the remaining listed columns trail the key and pages
+    # are answered without visiting the table. It supersedes the earlier
+    # is_latest-only and uncovered list indexes
+    cursor.execute("DROP INDEX IF EXISTS idx_transcription_is_latest")
+    cursor.execute("DROP INDEX IF EXISTS idx_transcription_latest_timestamp")
     cursor.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_transcription_is_latest
-        ON transcription_index(is_latest)
+        CREATE INDEX IF NOT EXISTS idx_transcription_latest_list
+        ON transcription_index(is_latest, timestamp DESC, conversation_id DESC, title, created_at)
         """
     )
 
@@ -134,6 +403,16 @@ def init_db() -> None:
     )
 
     # Create triggers to keep FTS5 table in sync with main table
+    _create_fts_triggers(cursor)
+
+
+def _create_fts_triggers(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the triggers that keep transcription_fts in sync row by row.
+
+    Args:
+        cursor: Cursor to execute the trigger statements with
+    """
     cursor.execute(
         """
         CREATE TRIGGER IF NOT EXISTS transcription_index_ai AFTER INSERT ON transcription_index BEGIN
@@ -163,5 +442,45 @@ def init_db() -> None:
         """
     )
 
-    conn.commit()
-    conn.close()
+
+def suspend_fts_sync() -> None:
+    """
+    Drop the per-row FTS5 sync triggers ahead of a bulk load.
+
+    While suspended, writes to transcription_index are not mirrored into
+    transcription_fts; call rebuild_fts() afterwards to repopulate the index
+    and restore the triggers. If the process dies first, the next init_db()
+    finds the triggers missing and rebuilds the index.
+    """
+    with transaction() as cursor:
+        for trigger in FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+
+def rebuild_fts() -> None:
+    """
+    Rebuild transcription_fts from transcription_index in one pass.
+
+    The rebuild and trigger re-creation run in a single transaction, so
+    steady-state writes resume incremental syncing as soon as it commits.
+    """
+    with transaction() as cursor:
+        cursor.execute("INSERT INTO transcription_fts(transcription_fts) VALUES('rebuild')")
+        _create_fts_triggers(cursor)
+
+
+def clear_index() -> None:
+    """
+    Delete every row of transcription_index and transcription_fts.
+
+    With the sync triggers dropped, the unqualified DELETE qualifies for
+    SQLite's truncate optimization instead of visiting each row, and the
+    FTS5 postings are cleared with a single 'delete-all'. Everything runs in
+    one transaction, so the triggers are back in place when it commits.
+    """
+    with transaction() as cursor:
+        for trigger in FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute("DELETE FROM transcription_index")
+        cursor.execute("INSERT INTO transcription_fts(transcription_fts) VALUES('delete-all')")
+        _create_fts_triggers(cursor)
@@ -1,45 +1,62 @@
 """Main FastAPI application."""
 
-from logly import logger
-
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from app.api.dependencies import get_superwhisper_repository, set_indexing_service
 from app.api.routes import conversations, health
 from app.core.config import settings
-from app.db import init_db
-from app.repositories.superwhisper import SuperwhisperRepository
+from app.db import close_db, init_db
+from app.repositories.superwhisper import shutdown_hash_executor
 from app.services.indexing_service import IndexingService
 
 
-logger.configure(
-    level="INFO",
-    color=False,
-    show_function=False,
-    show_module=False,
-    show_filename=False,
-    show_lineno=False,
-)
+@cache
+def _get_logger() -> Any:
+    """
+    Import and configure the logly logger on first use.
+
+    Deferring the import keeps logly off the module import path at startup.
+
+    Returns:
+        Configured logly logger
+    """
+    from logly import logger
+
+    logger.configure(
+        level="INFO",
+        color=False,
+        show_function=False,
+        show_module=False,
+        show_filename=False,
+        show_lineno=False,
+    )
+    return logger
 
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    debug=settings.debug,
-)
 
 # Global indexing service instance
 indexing_service: IndexingService | None = None
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and start background indexing on application startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Run application startup and shutdown.
+
+    On startup, initialize the database and start background indexing. On
+    shutdown, release worker threads and the database connection.
+    """
     global indexing_service
-    from app.api.dependencies import set_indexing_service
+
+    logger = _get_logger()
 
     # Initialize database schema
     logger.info("Initializing database schema...")
@@ -47,8 +64,7 @@ async def startup_event():
 
     # Start background indexing
     logger.info("Starting background transcription indexing...")
-    repository = SuperwhisperRepository(base_directory=Path(settings.superwhisper_directory))
-    indexing_service = IndexingService(transcription_repo=repository)
+    indexing_service = IndexingService(transcription_repo=get_superwhisper_repository())
 
     # Register indexing service globally for API access
     set_indexing_service(indexing_service)
@@ -57,6 +73,22 @@ async def startup_event():
     await indexing_service.start_background_sync()
     logger.info("Background indexing started")
 
+    yield
+
+    # Stop syncing first, so no sync touches the executor or database after release
+    await indexing_service.stop()
+    shutdown_hash_executor()
+    # Closing the last connection checkpoints the WAL into the database file
+    close_db()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    debug=settings.debug,
+    lifespan=lifespan,
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -70,22 +102,35 @@ app.add_middleware(
 app.include_router(health.router, prefix=settings.api_prefix, tags=["health"])
 app.include_router(conversations.router, prefix=settings.api_prefix, tags=["conversations"])
 
-# Mount static files directory
+# Static files are resolved once at import time instead of per request
 static_dir = Path(__file__).parent / "static"
+index_path = static_dir / "index.html"
+has_index = index_path.exists()
+cache_control = f"public, max-age={settings.static_cache_max_age}"
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files served with a Cache-Control header."""
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build the file response and let browsers cache it."""
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", cache_control)
+        return response
+
+
+# Mount static files directory
 if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
 
 
 @app.get("/")
 async def root() -> FileResponse:
     """Serve the main application page."""
-    index_path = Path(__file__).parent / "static" / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if has_index:
+        return FileResponse(index_path, headers={"Cache-Control": cache_control})
 
     # Fallback if static files not found
-    from fastapi.responses import JSONResponse
-
     return JSONResponse(
         {
             "message": f"Welcome to {settings.app_name}",
@@ -1,11 +1,24 @@
 """Domain models for transcription data."""
 
-from dataclasses import dataclass
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
+# Characters of transcription text kept in a conversation title
+TITLE_PREVIEW_LENGTH = 50
 
-@dataclass
+# Matches the same characters str.strip() removes, inverted
+_NON_WHITESPACE = re.compile(r"\S")
+
+# Sort key of conversations without an update time, ordering them last
+_MISSING_SORT_KEY = -(1 << 63)
+
+
+@dataclass(slots=True)
 class TranscriptionMetadata:
     """Metadata for a transcription."""
 
@@ -22,7 +35,7 @@ class TranscriptionMetadata:
     # Legacy field for backward compatibility
     transcription_text: str | None = None
 
-    # Timecode data
+    # Timecode data; not filled by scans, see TranscriptionRepository.load_segments
     segments: list[dict[str, str | float]] | None = None  # Detailed segments with timestamps
     transcription_with_timecodes: list[dict[str, str | float]] | None = None  # Legacy
 
@@ -43,8 +56,50 @@ class TranscriptionMetadata:
 
     created_at: datetime | None = None
 
-
-@dataclass
+    @property
+    def conversation_key(self) -> str:
+        """
+        ID of the conversation this transcription belongs to.
+
+        Re-processed versions of the same recording share an audio hash; without
+        one, the transcription is its own conversation, keyed by timestamp.
+        """
+        return self.audio_hash or str(self.timestamp)
+
+    @property
+    def title_preview(self) -> str:
+        """
+        Conversation title derived from this transcription.
+
+        The first TITLE_PREVIEW_LENGTH characters of the best available text
+        (llm > raw > preprocessed > legacy), falling back to the recording time.
+        """
+        text = (
+            self.llm_transcription
+            or self.raw_transcription
+            or self.preprocessed_transcription
+            or self.transcription_text
+        )
+
+        if text:
+            # Equivalent to stripping and truncating, but transcripts can be
+            # long, so only the preview itself is copied
+            first = _NON_WHITESPACE.search(text)
+            if first is None:
+                return ""
+            start = first.start()
+            end = start + TITLE_PREVIEW_LENGTH
+            if _NON_WHITESPACE.search(text, end):
+                return text[start:end] + "..."
+            return text[start:end].rstrip()
+
+        if self.created_at:
+            return self.created_at.strftime("Conversation on %Y-%m-%d %H:%M:%S")
+
+        return f"Conversation {self.timestamp}"
+
+
+@dataclass(slots=True)
 class AudioVersion:
     """Represents a version/attempt of transcription for the same audio."""
 
@@ -54,7 +109,7 @@ class AudioVersion:
     is_latest: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Represents a conversation with potentially multiple transcription versions."""
 
@@ -64,3 +119,88 @@ class Conversation:
     latest_version: AudioVersion | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    # updated_at as epoch nanoseconds, so sorting compares plain ints
+    _sort_key: int = field(default=_MISSING_SORT_KEY, repr=False, compare=False)
+
+
+def iter_conversations(transcriptions: Iterable[TranscriptionMetadata]) -> Iterator[Conversation]:
+    """
+    Group transcriptions into conversations, building each one lazily.
+
+    Transcriptions sharing a conversation_key become versions of one
+    conversation, newest first; the newest version is the latest one.
+    Conversations are yielded in no particular order, so consumers that
+    don't need one avoid holding them all at once.
+
+    Args:
+        transcriptions: Transcriptions to group
+
+    Yields:
+        Conversations
+    """
+    conversation_groups: defaultdict[str, list[TranscriptionMetadata]] = defaultdict(list)
+
+    # Sort once (newest first) so every group is already in version order;
+    # repositories return this order, making the sort a single linear pass
+    for trans in sorted(transcriptions, key=attrgetter("timestamp"), reverse=True):
+        conversation_groups[trans.conversation_key].append(trans)
+
+    for conv_id, trans_list in conversation_groups.items():
+        yield build_conversation(conv_id, trans_list)
+
+
+def build_conversation(
+    conversation_id: str, transcriptions: list[TranscriptionMetadata]
+) -> Conversation:
+    """
+    Build one conversation from its transcriptions.
+
+    Used directly when the transcriptions are known to form a single
+    conversation, skipping the grouping and sorting of group_transcriptions.
+
+    Args:
+        conversation_id: Conversation identifier
+        transcriptions: Non-empty list of the conversation's transcriptions,
+            newest first
+
+    Returns:
+        Conversation whose first (newest) version is the latest one
+    """
+    versions = [
+        AudioVersion(
+            version_id=str(trans.timestamp),
+            timestamp=trans.timestamp,
+            transcription=trans,
+            is_latest=idx == 0,
+        )
+        for idx, trans in enumerate(transcriptions)
+    ]
+
+    updated_at = transcriptions[0].created_at
+    return Conversation(
+        conversation_id=conversation_id,
+        title=transcriptions[0].title_preview,
+        versions=versions,
+        latest_version=versions[0],
+        created_at=transcriptions[-1].created_at,
+        updated_at=updated_at,
+        _sort_key=int(updated_at.timestamp() * 1e9) if updated_at else _MISSING_SORT_KEY,
+    )
+
+
+def group_transcriptions(transcriptions: Iterable[TranscriptionMetadata]) -> list[Conversation]:
+    """
+    Group transcriptions into conversations.
+
+    Args:
+        transcriptions: Transcriptions to group
+
+    Returns:
+        Conversations (see iter_conversations), most recently updated first
+    """
+    conversations = list(iter_conversations(transcriptions))
+
+    # Sort by most recent update
+    conversations.sort(key=attrgetter("_sort_key"), reverse=True)
+
+    return conversations
@@ -17,6 +17,39 @@ class TranscriptionRepository(ABC):
             base_directory: Base directory containing transcription files
         """
         self.base_directory = base_directory
+        # (conversation_id, version_id) -> audio file, filled as transcriptions load
+        self._audio_paths: dict[tuple[str, str], Path] = {}
+
+    def get_cached_audio_file_path(self, conversation_id: str, version_id: str) -> Path | None:
+        """
+        Look up a previously resolved audio file path.
+
+        Entries whose file no longer exists are dropped.
+
+        Args:
+            conversation_id: Conversation identifier
+            version_id: Version identifier (timestamp)
+
+        Returns:
+            Audio file path or None if not cached
+        """
+        key = (conversation_id, version_id)
+        path = self._audio_paths.get(key)
+        if path is not None and not path.exists():
+            del self._audio_paths[key]
+            return None
+        return path
+
+    def cache_audio_file_path(self, conversation_id: str, version_id: str, path: Path) -> None:
+        """
+        Remember the audio file path of a conversation version.
+
+        Args:
+            conversation_id: Conversation identifier
+            version_id: Version identifier (timestamp)
+            path: Audio file path
+        """
+        self._audio_paths[(conversation_id, version_id)] = path
 
     @abstractmethod
     async def get_all_transcriptions(self) -> list[TranscriptionMetadata]:
@@ -28,6 +61,23 @@ class TranscriptionRepository(ABC):
         """
         pass
 
+    async def load_segments(
+        self, transcription: TranscriptionMetadata
+    ) -> list[dict[str, str | float]] | None:
+        """
+        Load the timecode segments of a transcription.
+
+        Scans may leave segments out to keep listings light; repositories that
+        do should override this to read them on demand.
+
+        Args:
+            transcription: Transcription metadata
+
+        Returns:
+            Segments with start_time, end_time and text, or None if there are none
+        """
+        return transcription.segments
+
     @abstractmethod
     async def get_transcription_by_recording_id(
         self, recording_id: str
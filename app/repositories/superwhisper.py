@@ -1,13 +1,19 @@
 """Superwhisper transcription repository implementation."""
 
+import asyncio
 import hashlib
-import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from logly import logger
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 
-import aiofiles
+import orjson
 
 from app.models.transcription import TranscriptionMetadata
 from app.repositories.base import TranscriptionRepository
@@ -15,14 +21,199 @@ from app.repositories.superwhisper_cache import SuperWhisperCacheRepo
 
 logger = logging.getLogger(__name__)
 
+# Default maximum number of transcription directories loaded concurrently
+# during a scan
+SCAN_CONCURRENCY = 32
+
+# Audio file names in order of preference - SuperWhisper uses output.wav,
+# the rest are legacy naming or other extensions
+AUDIO_FILENAMES = (
+    "output.wav",
+    "audio.wav",
+    "output.mp3",
+    "audio.mp3",
+    "output.m4a",
+    "audio.m4a",
+)
+
+# Metadata file names in order of preference - SuperWhisper uses meta.json
+METADATA_FILENAMES = ("meta.json", "metadata.json")
+
+# hashlib algorithm used for audio hashes. Audio hashes double as conversation
+# IDs, so changing it re-keys every conversation in the index.
+HASH_ALGO = "sha256"
+
+# Seconds a recording ID that was not found by a full scan stays negatively
+# cached, so repeated lookups of an unknown ID don't rescan the archive. An
+# entry is also dropped as soon as a recording directory is added or removed.
+MISSING_RECORDING_TTL = 60.0
+
+# Maximum number of negatively cached recording IDs; the oldest are dropped
+MISSING_RECORDING_LIMIT = 1024
+
+# Maximum number of loaded transcriptions kept for reuse across scans
+ENTRY_CACHE_SIZE = 4096
+
+# Seconds the last get_all_transcriptions result is reused while the base
+# directory's mtime is unchanged. The mtime only changes when recording
+# directories are added or removed, so the age limit picks up files that are
+# still being written into a new directory.
+LIST_CACHE_TTL = 30.0
+
+# Dedicated executor for audio hashing, created on first use
+_hash_executor: ThreadPoolExecutor | None = None
+
+
+def is_timestamp_name(name: str) -> bool:
+    """
+    Check whether a directory name is a canonical Unix timestamp.
+
+    A cheap string check, so non-timestamp entries never reach int() and its
+    exception. isascii() rejects Unicode digits such as "²" that isdigit()
+    accepts but int() doesn't, and names with leading zeros are rejected
+    because str(int(name)) would not map back to the directory.
+
+    Args:
+        name: Directory name
+
+    Returns:
+        True if the name is a timestamp
+    """
+    return name.isascii() and name.isdigit() and name[0] != "0"
+
+
+def _hash_file(path: Path) -> str:
+    """
+    Calculate the HASH_ALGO hash of a file.
+
+    hashlib.file_digest reads the file in large blocks into a C buffer and
+    releases the GIL while hashing; OpenSSL uses hardware SHA extensions
+    where the CPU has them.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hash as hex string
+    """
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, HASH_ALGO).hexdigest()
+
+
+def _read_json(path: Path) -> dict:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed JSON content
+    """
+    return orjson.loads(path.read_bytes())
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """
+    Get the audio hashing executor, creating it on first use.
+
+    hashlib.file_digest hashes with the GIL released, so one thread per core
+    hashes in parallel without the pickling and start-up cost of processes.
+    Keeping hashing off the default executor leaves that free for the
+    directory listing and meta.json reads of a scan.
+
+    Returns:
+        Thread pool sized to the number of CPUs
+    """
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="audio-hash"
+        )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Shut down the audio hashing executor, if it was created."""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(cancel_futures=True)
+        _hash_executor = None
+
+
+def _find_transcription_files(
+    directory: Path,
+) -> tuple[Path | None, os.stat_result | None, Path | None, os.stat_result | None]:
+    """
+    Find the audio and metadata files of a transcription directory.
+
+    The directory is listed once with os.scandir and candidates are matched
+    by name, so only the chosen audio and metadata files are stat'ed.
+
+    Args:
+        directory: Directory containing transcription files
+
+    Returns:
+        Tuple of (audio file, audio file stat, metadata file, metadata file stat);
+        missing files are None
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return None, None, None, None
+
+    audio_file = None
+    audio_stat = None
+    for filename in AUDIO_FILENAMES:
+        entry = entries.get(filename)
+        if entry is None:
+            continue
+        try:
+            audio_stat = entry.stat()
+        except OSError:
+            # Broken symlink
+            continue
+        audio_file = Path(entry.path)
+        break
+
+    metadata_file = None
+    metadata_stat = None
+    for filename in METADATA_FILENAMES:
+        entry = entries.get(filename)
+        if entry is None:
+            continue
+        try:
+            metadata_stat = entry.stat()
+        except OSError:
+            # Broken symlink
+            continue
+        metadata_file = Path(entry.path)
+        break
+
+    return audio_file, audio_stat, metadata_file, metadata_stat
+
 
 class SuperwhisperRepository(TranscriptionRepository):
     """Repository for Superwhisper transcription files."""
 
-    def __init__(self, base_directory: Path):
-        """Initialize repository with base directory and cache."""
+    def __init__(self, base_directory: Path, scan_concurrency: int = SCAN_CONCURRENCY):
+        """
+        Initialize repository with base directory and cache.
+
+        Args:
+            base_directory: Base directory containing transcription directories
+            scan_concurrency: Maximum number of directories loaded at once
+        """
         super().__init__(base_directory)
+        self.scan_concurrency = scan_concurrency
         self._cache = SuperWhisperCacheRepo()
+        # recording_id -> (base directory mtime_ns, time checked), oldest first
+        self._missing_recording_ids: dict[str, tuple[int, float]] = {}
+        # timestamp -> (file signature, transcription), least recently used first
+        self._entry_cache: OrderedDict[int, tuple[tuple, TranscriptionMetadata]] = OrderedDict()
+        # (base directory mtime_ns, time loaded, transcriptions) of the last full load
+        self._cached_list: tuple[int, float, list[TranscriptionMetadata]] | None = None
 
     async def get_all_transcriptions(self) -> list[TranscriptionMetadata]:
         """
@@ -31,6 +222,8 @@ class SuperwhisperRepository(TranscriptionRepository):
         This method optimizes loading by checking if the cache is up-to-date.
         It compares the number of directories with the number of cache entries.
         If they match, it loads from cache without scanning the directory.
+        The result itself is reused for up to LIST_CACHE_TTL seconds while the
+        base directory's mtime is unchanged.
 
         Expected structure:
         base_directory/
@@ -44,121 +237,187 @@ class SuperwhisperRepository(TranscriptionRepository):
         Returns:
             List of transcription metadata
         """
-        if not self.base_directory.exists():
+        base_mtime = self._base_directory_mtime()
+        if base_mtime is None:
             logger.warning(f"Base directory does not exist: {self.base_directory}")
             return []
 
-        # Count directories and cache entries
-        dir_count = self._count_timestamp_directories()
-        cache_count = len(self._cache.get_all())
-
-        logger.info(f"Directory count: {dir_count}, Cache count: {cache_count}")
+        # Reuse the last result while no recording directory was added or removed
+        if self._cached_list is not None:
+            cached_mtime, loaded_at, cached = self._cached_list
+            if cached_mtime == base_mtime and time.monotonic() - loaded_at < LIST_CACHE_TTL:
+                logger.debug("Base directory unchanged, reusing last transcription list")
+                return list(cached)
 
-        # If counts match, load from cache
-        if dir_count == cache_count and cache_count > 0:
-            logger.info("Cache is up-to-date, loading from cache")
-            return await self._load_from_cache()
+        transcriptions = await self._load_all_transcriptions()
+        self._cached_list = (base_mtime, time.monotonic(), transcriptions)
+        return list(transcriptions)
 
-        # Counts differ, need to refresh cache by scanning directory
-        logger.warning(f"Cache out of sync (dirs: {dir_count}, cache: {cache_count}), refreshing cache")
-        return await self._load_from_directory_and_update_cache()
-
-    def _count_timestamp_directories(self) -> int:
+    async def _load_all_transcriptions(self) -> list[TranscriptionMetadata]:
         """
-        Count the number of valid timestamp directories in base directory.
+        Load all transcriptions, from cached directory paths when the cache is current.
 
         Returns:
-            Number of directories with timestamp names
+            List of transcription metadata, newest first
         """
-        count = 0
-        if not self.base_directory.exists():
-            return count
+        # Count directories (listed off the event loop) and cache entries
+        directories = await asyncio.to_thread(self._list_timestamp_directories)
+        dir_count = len(directories)
+        cache_count = self._cache.count()
 
-        for subdir in self.base_directory.iterdir():
-            if not subdir.is_dir():
-                continue
+        logger.info(f"Directory count: {dir_count}, Cache count: {cache_count}")
 
-            # Try to parse directory name as timestamp
-            try:
-                int(subdir.name)
-                count += 1
-            except ValueError:
-                # Skip directories that aren't timestamps
-                continue
+        # If counts match, load from cache
+        if dir_count == cache_count and cache_count > 0:
+            logger.info("Cache is up-to-date, loading from cache")
+            return await self._load_from_cache(directories)
 
-        return count
+        # Counts differ, need to refresh cache by scanning directory
+        logger.warning(
+            f"Cache out of sync (dirs: {dir_count}, cache: {cache_count}), refreshing cache"
+        )
+        return await self._load_from_directory_and_update_cache(directories)
 
-    async def _load_from_cache(self) -> list[TranscriptionMetadata]:
+    async def _load_from_cache(
+        self, directories: list[tuple[Path, int]]
+    ) -> list[TranscriptionMetadata]:
         """
         Load all transcriptions from cache without scanning the directory.
 
+        Args:
+            directories: (directory, timestamp) tuples from the current listing
+
         Returns:
             List of transcription metadata loaded from cache
         """
-        transcriptions: list[TranscriptionMetadata] = []
-        cache_entries = self._cache.get_all()
+        # Check cached paths against the listing instead of stat'ing each one
+        listed_paths = {directory for directory, _ in directories}
 
-        logger.debug(f"Loading {len(cache_entries)} transcriptions from cache")
+        logger.debug("Loading transcriptions from cache")
 
-        for entry in cache_entries:
+        cached_directories: list[tuple[Path, int]] = []
+        for entry in self._cache.iter_all():
             try:
                 timestamp = int(entry["internal_id"])
                 directory_path = Path(entry["directory_path"])
-
-                # Load transcription from the cached directory path
-                if directory_path.exists() and directory_path.is_dir():
-                    transcription = await self._load_transcription_from_directory(
-                        directory_path, timestamp
-                    )
-                    if transcription:
-                        transcriptions.append(transcription)
-                else:
-                    logger.warning(f"Cached directory not found: {directory_path}, will refresh cache")
-                    # Directory doesn't exist, cache is stale, fall back to full scan
-                    return await self._load_from_directory_and_update_cache()
-            except (ValueError, KeyError) as e:
+            except (ValueError, IndexError) as e:  # sqlite3.Row raises IndexError
                 logger.warning(f"Invalid cache entry: {e}, skipping")
                 continue
 
+            if directory_path not in listed_paths:
+                logger.warning(f"Cached directory not found: {directory_path}, will refresh cache")
+                # Directory doesn't exist, cache is stale, fall back to full scan
+                return await self._load_from_directory_and_update_cache(directories)
+
+            cached_directories.append((directory_path, timestamp))
+
+        # Load transcriptions from the cached directory paths
+        transcriptions = await self._load_directories(cached_directories)
+
         # Sort by timestamp (newest first)
-        transcriptions.sort(key=lambda x: x.timestamp, reverse=True)
+        transcriptions.sort(key=attrgetter("timestamp"), reverse=True)
         logger.info(f"Loaded {len(transcriptions)} transcriptions from cache")
         return transcriptions
 
-    async def _load_from_directory_and_update_cache(self) -> list[TranscriptionMetadata]:
+    async def _load_from_directory_and_update_cache(
+        self, directories: list[tuple[Path, int]] | None = None
+    ) -> list[TranscriptionMetadata]:
         """
         Load all transcriptions by scanning the directory and update the cache.
 
+        Args:
+            directories: Already listed (directory, timestamp) tuples, if any
+
         Returns:
             List of transcription metadata
         """
-        transcriptions: list[TranscriptionMetadata] = []
-
         logger.debug("Scanning directory for transcriptions")
 
-        # Iterate through subdirectories
-        for subdir in self.base_directory.iterdir():
-            if not subdir.is_dir():
-                continue
-
-            # Try to parse directory name as timestamp
-            try:
-                timestamp = int(subdir.name)
-            except ValueError:
-                # Skip directories that aren't timestamps
-                continue
-
-            transcription = await self._load_transcription_from_directory(
-                subdir, timestamp
-            )
-            if transcription:
-                transcriptions.append(transcription)
+        # Enumerate off the event loop, then load directories concurrently
+        if directories is None:
+            directories = await asyncio.to_thread(self._list_timestamp_directories)
+        transcriptions = await self._load_directories(directories)
 
         # Sort by timestamp (newest first)
-        transcriptions.sort(key=lambda x: x.timestamp, reverse=True)
+        transcriptions.sort(key=attrgetter("timestamp"), reverse=True)
         logger.info(f"Scanned and loaded {len(transcriptions)} transcriptions from directory")
         return transcriptions
 
+    def _list_timestamp_directories(self) -> list[tuple[Path, int]]:
+        """
+        List the timestamp-named subdirectories of the base directory.
+
+        Returns:
+            List of (directory, timestamp) tuples
+        """
+        # DirEntry.is_dir() uses the dirent type, so no stat per entry
+        with os.scandir(self.base_directory) as it:
+            return [
+                (Path(entry.path), int(entry.name))
+                for entry in it
+                if is_timestamp_name(entry.name) and entry.is_dir()
+            ]
+
+    async def _load_directories(
+        self, directories: list[tuple[Path, int]]
+    ) -> list[TranscriptionMetadata]:
+        """
+        Load transcriptions from several directories concurrently.
+
+        Args:
+            directories: List of (directory, timestamp) tuples
+
+        Returns:
+            Successfully loaded transcriptions, in completion order
+        """
+        return [transcription async for transcription in self._iter_directories(directories)]
+
+    async def _iter_directories(
+        self, directories: list[tuple[Path, int]]
+    ) -> AsyncIterator[TranscriptionMetadata]:
+        """
+        Load transcriptions from several directories concurrently, yielding each when ready.
+
+        At most scan_concurrency directories are loaded at once to bound the
+        number of open files; a new load task is only created when one
+        finishes, so pending tasks never pile up for large directories. Loads
+        still pending when the consumer stops iterating are cancelled. Cache
+        rows of the loaded directories are written in one transaction once
+        iteration ends.
+
+        Args:
+            directories: List of (directory, timestamp) tuples
+
+        Yields:
+            Successfully loaded transcriptions, in completion order
+        """
+        cache_rows: list[tuple[str, str, str, str | None]] = []
+        remaining = iter(directories)
+        pending: set[asyncio.Task] = set()
+
+        def start_loads(count: int) -> None:
+            for directory, timestamp in islice(remaining, count):
+                pending.add(
+                    asyncio.ensure_future(
+                        self._load_transcription_from_directory(directory, timestamp, cache_rows)
+                    )
+                )
+
+        start_loads(self.scan_concurrency)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                start_loads(len(done))
+                for task in done:
+                    transcription = task.result()
+                    if transcription:
+                        yield transcription
+        finally:
+            for task in pending:
+                task.cancel()
+            if cache_rows:
+                self._cache.bulk_upsert(cache_rows)
+
     async def get_transcription_by_timestamp(
         self, timestamp: int
     ) -> TranscriptionMetadata | None:
@@ -172,7 +431,8 @@ class SuperwhisperRepository(TranscriptionRepository):
             Transcription metadata or None if not found
         """
         subdir = self.base_directory / str(timestamp)
-        if not subdir.exists() or not subdir.is_dir():
+        # is_dir() is False for missing paths too, so one stat covers both
+        if not subdir.is_dir():
             return None
 
         return await self._load_transcription_from_directory(subdir, timestamp)
@@ -194,28 +454,61 @@ class SuperwhisperRepository(TranscriptionRepository):
         """
         # Try cache first
         cache_entry = self._cache.get_by_recording_id(recording_id)
-        logger.info(f"Recording cache state {recording_id}: {bool(cache_entry)}")
+        logger.debug(f"Recording cache state {recording_id}: {bool(cache_entry)}")
         if cache_entry:
-            logger.debug(f"Cache hit for recording_id={recording_id}, internal_id={cache_entry['internal_id']}")
+            logger.debug(
+                f"Cache hit for recording_id={recording_id}, "
+                f"internal_id={cache_entry['internal_id']}"
+            )
             # Load from cached directory path
             timestamp = int(cache_entry["internal_id"])
             return await self.get_transcription_by_timestamp(timestamp)
 
-        # If not in cache, scan all transcriptions to populate cache
-        # This will also populate the cache with this recording if it exists
-        logger.warning(f"Cache miss for recording_id={recording_id}, scanning all transcriptions to populate cache")
-        await self.get_all_transcriptions()
-
-        # Try cache again
-        cache_entry = self._cache.get_by_recording_id(recording_id)
-        if cache_entry:
-            logger.debug(f"Found recording_id={recording_id} after cache population")
-            timestamp = int(cache_entry["internal_id"])
-            return await self.get_transcription_by_timestamp(timestamp)
+        # Recently confirmed missing and no directory added since - don't rescan
+        base_mtime = self._base_directory_mtime()
+        missing = self._missing_recording_ids.pop(recording_id, None)
+        if missing is not None:
+            checked_mtime, checked_at = missing
+            if (
+                checked_mtime == base_mtime
+                and time.monotonic() - checked_at < MISSING_RECORDING_TTL
+            ):
+                logger.debug(
+                    f"Recording recently not found, skipping scan: recording_id={recording_id}"
+                )
+                self._missing_recording_ids[recording_id] = missing
+                return None
+
+        # If not in cache, scan all transcriptions (this also populates the
+        # cache) and look the recording up in the scan result directly
+        logger.debug(
+            f"Cache miss for recording_id={recording_id}, "
+            "scanning all transcriptions to populate cache"
+        )
+        for transcription in await self.get_all_transcriptions():
+            # The cache falls back to the timestamp when there is no recording ID
+            if (transcription.recording_id or str(transcription.timestamp)) == recording_id:
+                logger.debug(f"Found recording_id={recording_id} after cache population")
+                return transcription
 
         logger.warning(f"Recording not found: recording_id={recording_id}")
+        self._missing_recording_ids[recording_id] = (base_mtime, time.monotonic())
+        if len(self._missing_recording_ids) > MISSING_RECORDING_LIMIT:
+            del self._missing_recording_ids[next(iter(self._missing_recording_ids))]
         return None
 
+    def _base_directory_mtime(self) -> int | None:
+        """
+        Get the base directory's mtime, which changes when recordings are added or removed.
+
+        Returns:
+            mtime in nanoseconds, or None if the directory doesn't exist
+        """
+        try:
+            return self.base_directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     async def read_audio_file(self, transcription: TranscriptionMetadata) -> bytes:
         """
         Read the audio file for a transcription.
@@ -234,11 +527,14 @@ class SuperwhisperRepository(TranscriptionRepository):
                 f"No audio file found for transcription {transcription.timestamp}"
             )
 
-        async with aiofiles.open(transcription.audio_file, "rb") as f:
-            return await f.read()
+        # A single threaded read instead of aiofiles' open/read/close round trips
+        return await asyncio.to_thread(transcription.audio_file.read_bytes)
 
     async def _load_transcription_from_directory(
-        self, directory: Path, timestamp: int
+        self,
+        directory: Path,
+        timestamp: int,
+        cache_rows: list[tuple[str, str, str, str | None]] | None = None,
     ) -> TranscriptionMetadata | None:
         """
         Load transcription metadata from a directory.
@@ -250,42 +546,55 @@ class SuperwhisperRepository(TranscriptionRepository):
         Args:
             directory: Directory containing transcription files
             timestamp: Unix timestamp
+            cache_rows: If given, the cache row is appended here for a later
+                bulk_upsert instead of being written immediately
 
         Returns:
             TranscriptionMetadata or None if loading fails
         """
-        # Look for audio file - SuperWhisper uses output.wav
-        audio_file = directory / "output.wav"
-        if not audio_file.exists():
-            # Fallback to legacy naming or other extensions
-            for filename in ["audio.wav", "output.mp3", "audio.mp3", "output.m4a", "audio.m4a"]:
-                potential_audio = directory / filename
-                if potential_audio.exists():
-                    audio_file = potential_audio
-                    break
-            else:
-                audio_file = None
-
-        # Look for metadata file - SuperWhisper uses meta.json
-        metadata_file = directory / "meta.json"
-        if not metadata_file.exists():
-            # Fallback to legacy naming
-            metadata_file = directory / "metadata.json"
-
-        metadata_content = None
-        if metadata_file.exists():
-            try:
-                async with aiofiles.open(metadata_file, "r", encoding="utf-8") as f:
-                    content = await f.read()
-                    metadata_content = json.loads(content)
-            except (json.JSONDecodeError, OSError):
-                pass
+        # List the directory once instead of probing each candidate file
+        audio_file, audio_stat, metadata_file, metadata_stat = await asyncio.to_thread(
+            _find_transcription_files, directory
+        )
+
+        # Reuse the previously loaded transcription while its files are unchanged
+        signature = (
+            audio_file,
+            audio_stat and (audio_stat.st_size, audio_stat.st_mtime_ns),
+            metadata_file,
+            metadata_stat and (metadata_stat.st_size, metadata_stat.st_mtime_ns),
+        )
+        cached = self._entry_cache.get(timestamp)
+        if cached is not None and cached[0] == signature:
+            self._entry_cache.move_to_end(timestamp)
+            transcription = cached[1]
+            # Scans still rewrite the recording cache row, which may have been
+            # cleared or gone stale since the transcription was loaded
+            if cache_rows is not None:
+                cache_rows.append(
+                    (
+                        transcription.recording_id or str(timestamp),
+                        str(timestamp),
+                        str(directory),
+                        transcription.audio_hash,
+                    )
+                )
+            if audio_file:
+                self.cache_audio_file_path(
+                    transcription.audio_hash or str(timestamp), str(timestamp), audio_file
+                )
+            return transcription
+
+        # Reading meta.json and hashing the audio are independent, so overlap them
+        metadata_content, audio_hash = await asyncio.gather(
+            self._read_metadata(metadata_file),
+            self._get_audio_hash(audio_file, audio_stat),
+        )
 
         # Extract transcription data from SuperWhisper meta.json
         raw_transcription = None
         preprocessed_transcription = None
         llm_transcription = None
-        segments = None
         duration = None
         language = None
         model_name = None
@@ -300,11 +609,9 @@ class SuperwhisperRepository(TranscriptionRepository):
             raw_transcription = metadata_content.get("rawResult")
             preprocessed_transcription = metadata_content.get("result")
             llm_transcription = metadata_content.get("llmResult")
-            raw_segments = metadata_content.get("segments")
 
-            # Normalize segment field names
-            # SuperWhisper uses 'start'/'end' but we expect 'start_time'/'end_time'
-            segments = self._normalize_segments(raw_segments) if raw_segments else None
+            # Segments are large and only the conversation view needs them, so
+            # they are left out here and read by load_segments() on demand
 
             duration = metadata_content.get("duration")
             language = metadata_content.get("languageSelected")
@@ -313,19 +620,16 @@ class SuperwhisperRepository(TranscriptionRepository):
             mode_name = metadata_content.get("modeName")
             processing_time = metadata_content.get("processingTime")
 
-        # Calculate audio hash for version detection
-        audio_hash = None
-        if audio_file and audio_file.exists():
-            audio_hash = await self._calculate_audio_hash(audio_file)
-
-        # Parse datetime from meta.json or use timestamp
+        # Parse datetime from meta.json or use timestamp. The meta.json value is
+        # SuperWhisper's wall-clock recording time, so it wins when present;
+        # Python 3.11's fromisoformat is a C parser, so this stays cheap.
         created_at = None
-        if metadata_content and "datetime" in metadata_content:
+        datetime_str = metadata_content.get("datetime") if metadata_content else None
+        if isinstance(datetime_str, str):
             try:
                 # SuperWhisper format: "2025-11-13T01:42:15"
-                datetime_str = metadata_content["datetime"]
                 created_at = datetime.fromisoformat(datetime_str)
-            except (ValueError, TypeError):
+            except ValueError:
                 pass
 
         if not created_at:
@@ -338,27 +642,35 @@ class SuperwhisperRepository(TranscriptionRepository):
         # ALWAYS cache the mapping - use timestamp as fallback if no recording_id
         # This ensures the cache is populated for all transcriptions
         cache_recording_id = recording_id if recording_id else str(timestamp)
-        logger.debug(f"Caching transcription: recording_id={cache_recording_id}, timestamp={timestamp}, audio_hash={audio_hash}")
-
-        self._cache.upsert(
-            recording_id=cache_recording_id,
-            internal_id=str(timestamp),
-            directory_path=str(directory),
-            audio_hash=audio_hash,
+        logger.debug(
+            f"Caching transcription: recording_id={cache_recording_id}, "
+            f"timestamp={timestamp}, audio_hash={audio_hash}"
         )
 
-        return TranscriptionMetadata(
+        if cache_rows is not None:
+            cache_rows.append((cache_recording_id, str(timestamp), str(directory), audio_hash))
+        else:
+            self._cache.upsert(
+                recording_id=cache_recording_id,
+                internal_id=str(timestamp),
+                directory_path=str(directory),
+                audio_hash=audio_hash,
+            )
+
+        # Conversations are keyed by audio hash, falling back to the timestamp
+        if audio_file:
+            self.cache_audio_file_path(audio_hash or str(timestamp), str(timestamp), audio_file)
+
+        transcription = TranscriptionMetadata(
             timestamp=timestamp,
             directory=directory,
-            audio_file=audio_file if audio_file and audio_file.exists() else None,
-            metadata_file=metadata_file if metadata_file.exists() else None,
+            audio_file=audio_file,
+            metadata_file=metadata_file,
             recording_id=recording_id,
             raw_transcription=raw_transcription,
             preprocessed_transcription=preprocessed_transcription,
             llm_transcription=llm_transcription,
             transcription_text=transcription_text,
-            segments=segments,
-            transcription_with_timecodes=segments,  # Legacy field
             llm_output=llm_transcription,  # Legacy field
             duration=duration,
             language=language,
@@ -370,9 +682,67 @@ class SuperwhisperRepository(TranscriptionRepository):
             created_at=created_at,
         )
 
+        self._entry_cache[timestamp] = (signature, transcription)
+        self._entry_cache.move_to_end(timestamp)
+        if len(self._entry_cache) > ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False)
+        return transcription
+
+    async def _read_metadata(self, metadata_file: Path | None) -> dict | None:
+        """
+        Read and parse a meta.json file.
+
+        Args:
+            metadata_file: Path to the metadata file, if any
+
+        Returns:
+            Parsed metadata, or None if there is no readable metadata
+        """
+        if not metadata_file:
+            return None
+
+        try:
+            # One thread hop reads and parses the file, so neither the read nor
+            # parsing the (segment-heavy) JSON runs on the event loop
+            return await asyncio.to_thread(_read_json, metadata_file)
+        except (orjson.JSONDecodeError, OSError):
+            return None
+
+    async def _get_audio_hash(
+        self, audio_file: Path | None, stat: os.stat_result | None
+    ) -> str | None:
+        """
+        Get the audio hash, reusing the cached value while the file is unchanged.
+
+        Args:
+            audio_file: Path to audio file, if any
+            stat: Stat result of the audio file
+
+        Returns:
+            Hash as hex string, empty string if the file can't be read,
+            or None if there is no audio file
+        """
+        if not audio_file or not stat:
+            return None
+
+        # Cached hashes carry an algorithm prefix; others are recomputed
+        path = str(audio_file)
+        cached_hash = self._cache.get_hash_if_fresh(path, stat.st_size, stat.st_mtime_ns)
+        if cached_hash is not None:
+            algo, _, audio_hash = cached_hash.partition(":")
+            if algo == HASH_ALGO:
+                return audio_hash
+
+        audio_hash = await self._calculate_audio_hash(audio_file)
+        if audio_hash:
+            self._cache.upsert_hash(
+                path, stat.st_size, stat.st_mtime_ns, f"{HASH_ALGO}:{audio_hash}"
+            )
+        return audio_hash
+
     async def _calculate_audio_hash(self, audio_file: Path) -> str:
         """
-        Calculate SHA256 hash of audio file for version detection.
+        Calculate HASH_ALGO hash of audio file for version detection.
 
         This allows us to identify when different recordings are re-processed
         versions of the same audio.
@@ -381,19 +751,57 @@ class SuperwhisperRepository(TranscriptionRepository):
             audio_file: Path to audio file
 
         Returns:
-            SHA256 hash as hex string
+            Hash as hex string
         """
-        sha256_hash = hashlib.sha256()
         try:
-            async with aiofiles.open(audio_file, "rb") as f:
-                # Read in chunks to handle large files
-                while chunk := await f.read(8192):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+            # Hash on the hashing pool so large files don't block the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_hash_executor(), _hash_file, audio_file)
         except OSError:
             # If we can't read the file, return empty hash
             return ""
 
+    async def load_segments(
+        self, transcription: TranscriptionMetadata
+    ) -> list[dict[str, str | float]] | None:
+        """
+        Load the timecode segments of a transcription from its meta.json.
+
+        Scans leave segments out, so the file is re-read and normalized in a
+        worker thread to keep the event loop free.
+
+        Args:
+            transcription: Transcription metadata
+
+        Returns:
+            Normalized segments, or None if there are none
+        """
+        if transcription.segments is not None:
+            return transcription.segments
+        if transcription.metadata_file is None:
+            return None
+        return await asyncio.to_thread(self._load_segments, transcription.metadata_file)
+
+    def _load_segments(self, metadata_file: Path) -> list[dict] | None:
+        """
+        Load normalized segments from a meta.json file.
+
+        Args:
+            metadata_file: Path to the metadata file
+
+        Returns:
+            Normalized segments, or None if the file has none or can't be read
+        """
+        try:
+            metadata_content = _read_json(metadata_file)
+        except (orjson.JSONDecodeError, OSError):
+            return None
+
+        # Normalize segment field names
+        # SuperWhisper uses 'start'/'end' but we expect 'start_time'/'end_time'
+        raw_segments = metadata_content.get("segments")
+        return self._normalize_segments(raw_segments) if raw_segments else None
+
     def _normalize_segments(self, segments: list[dict]) -> list[dict]:
         """
         Normalize segment field names to match our expected format.
@@ -407,16 +815,11 @@ class SuperwhisperRepository(TranscriptionRepository):
         Returns:
             Normalized segments with start_time, end_time, and text fields
         """
-        if not segments:
-            return []
-
-        normalized = []
-        for segment in segments:
-            normalized_segment = {
+        return [
+            {
                 "start_time": segment.get("start", 0),
                 "end_time": segment.get("end", 0),
                 "text": segment.get("text", ""),
             }
-            normalized.append(normalized_segment)
-
-        return normalized
+            for segment in segments
+        ]
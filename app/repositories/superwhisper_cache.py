@@ -1,8 +1,23 @@
 """Repository for caching SuperWhisper recording ID mappings."""
 
-from typing import Optional
 import sqlite3
-from app.db.database import get_db
+from collections.abc import Iterator
+from typing import Optional
+
+from app.db.database import get_db, transaction
+
+# Insert-or-update of one cache entry, parameterized as
+# (recording_id, internal_id, directory_path, audio_hash)
+UPSERT_SQL = """
+    INSERT INTO superwhisper_cache
+        (recording_id, internal_id, directory_path, audio_hash, updated_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(recording_id) DO UPDATE SET
+        internal_id = excluded.internal_id,
+        directory_path = excluded.directory_path,
+        audio_hash = excluded.audio_hash,
+        updated_at = CURRENT_TIMESTAMP
+"""
 
 
 class SuperWhisperCacheRepo:
@@ -13,7 +28,7 @@ class SuperWhisperCacheRepo:
     and the IDs used in our application (timestamps).
     """
 
-    def get_by_recording_id(self, recording_id: str) -> Optional[dict]:
+    def get_by_recording_id(self, recording_id: str) -> Optional[sqlite3.Row]:
         """
         Get cache entry by SuperWhisper recording ID.
 
@@ -21,7 +36,7 @@ class SuperWhisperCacheRepo:
             recording_id: SuperWhisper recording ID
 
         Returns:
-            Cache entry dict or None if not found
+            Cache entry row or None if not found
         """
         conn = get_db()
         cursor = conn.cursor()
@@ -35,14 +50,9 @@ class SuperWhisperCacheRepo:
             (recording_id,),
         )
 
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return dict(row)
-        return None
+        return cursor.fetchone()
 
-    def get_by_internal_id(self, internal_id: str) -> Optional[dict]:
+    def get_by_internal_id(self, internal_id: str) -> Optional[sqlite3.Row]:
         """
         Get cache entry by internal ID (timestamp).
 
@@ -50,7 +60,7 @@ class SuperWhisperCacheRepo:
             internal_id: Internal ID (timestamp)
 
         Returns:
-            Cache entry dict or None if not found
+            Cache entry row or None if not found
         """
         conn = get_db()
         cursor = conn.cursor()
@@ -64,14 +74,9 @@ class SuperWhisperCacheRepo:
             (internal_id,),
         )
 
-        row = cursor.fetchone()
-        conn.close()
+        return cursor.fetchone()
 
-        if row:
-            return dict(row)
-        return None
-
-    def get_by_audio_hash(self, audio_hash: str) -> list[dict]:
+    def get_by_audio_hash(self, audio_hash: str) -> list[sqlite3.Row]:
         """
         Get all cache entries with the given audio hash.
 
@@ -79,7 +84,7 @@ class SuperWhisperCacheRepo:
             audio_hash: Audio file hash
 
         Returns:
-            List of cache entry dicts with matching audio_hash
+            List of cache entry rows (indexable by column name) with matching audio_hash
         """
         conn = get_db()
         cursor = conn.cursor()
@@ -94,17 +99,15 @@ class SuperWhisperCacheRepo:
             (audio_hash,),
         )
 
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        # sqlite3.Row already supports entry["column"]; no per-row dict copy
+        return cursor.fetchall()
 
-    def get_all(self) -> list[dict]:
+    def get_all(self) -> list[sqlite3.Row]:
         """
         Get all cache entries.
 
         Returns:
-            List of cache entry dicts
+            List of cache entry rows, indexable by column name
         """
         conn = get_db()
         cursor = conn.cursor()
@@ -117,10 +120,49 @@ class SuperWhisperCacheRepo:
             """
         )
 
-        rows = cursor.fetchall()
-        conn.close()
+        # sqlite3.Row already supports entry["column"]; no per-row dict copy
+        return cursor.fetchall()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """
+        Iterate over all cache entries, fetching them in batches.
+
+        Unlike get_all, at most batch_size rows are held in memory at once.
+        The created_at/updated_at columns are left out, so bulk loads don't
+        run the TIMESTAMP converter twice per row.
+
+        Args:
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Cache entry rows, indexable by column name
+        """
+        conn = get_db()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT recording_id, internal_id, directory_path, audio_hash
+            FROM superwhisper_cache
+            """
+        )
+
+        while batch := cursor.fetchmany(batch_size):
+            yield from batch
+
+    def count(self) -> int:
+        """
+        Count cache entries without loading them.
+
+        Returns:
+            Number of cache entries
+        """
+        conn = get_db()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM superwhisper_cache")
 
-        return [dict(row) for row in rows]
+        return cursor.fetchone()[0]
 
     def upsert(
         self,
@@ -138,24 +180,71 @@ class SuperWhisperCacheRepo:
             directory_path: Path to the recording directory
             audio_hash: Optional audio file hash
         """
+        with transaction() as cursor:
+            cursor.execute(UPSERT_SQL, (recording_id, internal_id, directory_path, audio_hash))
+
+    def bulk_upsert(self, rows: list[tuple[str, str, str, Optional[str]]]) -> None:
+        """
+        Insert or update many cache entries in one transaction.
+
+        Args:
+            rows: (recording_id, internal_id, directory_path, audio_hash) tuples
+        """
+        with transaction() as cursor:
+            cursor.executemany(UPSERT_SQL, rows)
+
+    def get_hash_if_fresh(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """
+        Get the cached hash of an audio file if the file is unchanged.
+
+        Args:
+            path: Audio file path
+            size: Current file size in bytes
+            mtime_ns: Current modification time in nanoseconds
+
+        Returns:
+            Cached audio hash, or None if missing or the file has changed
+        """
         conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute(
             """
-            INSERT INTO superwhisper_cache (recording_id, internal_id, directory_path, audio_hash, updated_at)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(recording_id) DO UPDATE SET
-                internal_id = excluded.internal_id,
-                directory_path = excluded.directory_path,
-                audio_hash = excluded.audio_hash,
-                updated_at = CURRENT_TIMESTAMP
+            SELECT audio_hash
+            FROM audio_hash_cache
+            WHERE path = ? AND size = ? AND mtime_ns = ?
             """,
-            (recording_id, internal_id, directory_path, audio_hash),
+            (path, size, mtime_ns),
         )
 
-        conn.commit()
-        conn.close()
+        row = cursor.fetchone()
+
+        if row:
+            return row["audio_hash"]
+        return None
+
+    def upsert_hash(self, path: str, size: int, mtime_ns: int, audio_hash: str) -> None:
+        """
+        Insert or update the cached hash of an audio file.
+
+        Args:
+            path: Audio file path
+            size: File size in bytes when hashed
+            mtime_ns: Modification time in nanoseconds when hashed
+            audio_hash: Audio file hash
+        """
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO audio_hash_cache (path, size, mtime_ns, audio_hash)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    audio_hash = excluded.audio_hash
+                """,
+                (path, size, mtime_ns, audio_hash),
+            )
 
     def delete(self, recording_id: str) -> None:
         """
@@ -164,26 +253,16 @@ class SuperWhisperCacheRepo:
         Args:
             recording_id: SuperWhisper recording ID
         """
-        conn = get_db()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            DELETE FROM superwhisper_cache
-            WHERE recording_id = ?
-            """,
-            (recording_id,),
-        )
-
-        conn.commit()
-        conn.close()
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM superwhisper_cache
+                WHERE recording_id = ?
+                """,
+                (recording_id,),
+            )
 
     def clear_all(self) -> None:
         """Clear all cache entries."""
-        conn = get_db()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM superwhisper_cache")
-
-        conn.commit()
-        conn.close()
+        with transaction() as cursor:
+            cursor.execute("DELETE FROM superwhisper_cache")
@@ -1,11 +1,432 @@
 """Repository for managing transcription search index."""
 
-from typing import Optional
 import sqlite3
-from app.db.database import get_db
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from functools import cache
+from itertools import chain
+from typing import NamedTuple, Optional
+
+from app.db.database import clear_index, get_db, to_epoch_seconds, transaction
 from app.models.transcription import TranscriptionMetadata
 
 
+class SearchResult(NamedTuple):
+    """A search hit, built positionally from a SEARCH_SQL row."""
+
+    conversation_id: str
+    version_id: str
+    timestamp: int
+    title: str
+    audio_hash: Optional[str]
+    duration: Optional[float]
+    language: Optional[str]
+    created_at: Optional[datetime]
+    # Number of versions of the conversation, matching or not
+    version_count: int
+    rank: float
+    # Highlighted title/transcription snippets, empty when only the other matched
+    match_snippets: list[str]
+
+
+# Maximum number of cached counts; search counts are keyed by the user's query
+COUNT_CACHE_SIZE = 256
+
+
+class _CountCache:
+    """
+    In-process cache of conversation counts.
+
+    Counts are keyed by the query that produced them and dropped whenever the
+    index is written to, so COUNT queries only run again after the data changes.
+    At most COUNT_CACHE_SIZE counts are kept; the oldest is dropped first.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[tuple, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Current generation, bumped on every invalidation."""
+        return self._generation
+
+    def get(self, key: tuple) -> Optional[int]:
+        """
+        Get a cached count.
+
+        Args:
+            key: Cache key describing the counted query
+
+        Returns:
+            Cached count or None if not cached
+        """
+        return self._counts.get(key)
+
+    def store(self, key: tuple, value: int, generation: int) -> None:
+        """
+        Cache a count computed during the given generation.
+
+        Counts computed before the latest invalidation are discarded.
+
+        Args:
+            key: Cache key describing the counted query
+            value: Count to cache
+            generation: Generation observed before the count was computed
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._counts[key] = value
+                if len(self._counts) > COUNT_CACHE_SIZE:
+                    del self._counts[next(iter(self._counts))]
+
+    def invalidate(self) -> None:
+        """Drop all cached counts."""
+        with self._lock:
+            self._generation += 1
+            self._counts.clear()
+
+
+# Rows per multi-row upsert statement: 30 rows x 15 parameters stays under
+# SQLite's historical 999-parameter limit
+UPSERT_BATCH_SIZE = 30
+
+_UPSERT_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
+
+
+# Re-indexing an unchanged version leaves its row alone: no page writes, no
+# FTS trigger and no new updated_at
+_UPSERT_CHANGED = " OR ".join(
+    f"{column} IS NOT excluded.{column}"
+    for column in (
+        "timestamp", "title", "raw_transcription", "preprocessed_transcription",
+        "llm_transcription", "audio_hash", "duration", "language", "model_name",
+        "language_model_name", "mode_name", "created_at", "is_latest",
+    )
+)
+
+
+@cache
+def _upsert_sql(row_count: int) -> str:
+    """
+    Build an insert-or-update statement for several versions at once.
+
+    Statements are cached per row count, so full batches reuse one prepared
+    statement from the connection's statement cache.
+
+    Args:
+        row_count: Number of VALUES row groups
+
+    Returns:
+        SQL statement taking row_count parameter groups
+    """
+    return f"""
+    INSERT INTO transcription_index (
+        conversation_id, version_id, timestamp, title,
+        raw_transcription, preprocessed_transcription, llm_transcription,
+        audio_hash, duration, language, model_name, language_model_name,
+        mode_name, created_at, is_latest, updated_at
+    )
+    VALUES {", ".join([_UPSERT_ROW] * row_count)}
+    ON CONFLICT(conversation_id, version_id) DO UPDATE SET
+        timestamp = excluded.timestamp,
+        title = excluded.title,
+        raw_transcription = excluded.raw_transcription,
+        preprocessed_transcription = excluded.preprocessed_transcription,
+        llm_transcription = excluded.llm_transcription,
+        audio_hash = excluded.audio_hash,
+        duration = excluded.duration,
+        language = excluded.language,
+        model_name = excluded.model_name,
+        language_model_name = excluded.language_model_name,
+        mode_name = excluded.mode_name,
+        created_at = excluded.created_at,
+        is_latest = excluded.is_latest,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE {_UPSERT_CHANGED}
+    """
+
+
+def _upsert_params(
+    conversation_id: str,
+    version_id: str,
+    timestamp: int,
+    transcription: TranscriptionMetadata,
+    title: str,
+    is_latest: bool,
+) -> tuple:
+    """
+    Build the upsert parameters for one transcription.
+
+    Returns:
+        Parameter tuple in transcription_index column order
+    """
+    return (
+        conversation_id,
+        version_id,
+        timestamp,
+        title,
+        transcription.raw_transcription,
+        transcription.preprocessed_transcription,
+        transcription.llm_transcription,
+        transcription.audio_hash,
+        transcription.duration,
+        transcription.language,
+        transcription.model_name,
+        transcription.language_model_name,
+        transcription.mode_name,
+        # Integer seconds take a few bytes per row instead of a 19+ byte string
+        to_epoch_seconds(transcription.created_at) if transcription.created_at else None,
+        1 if is_latest else 0,
+    )
+
+
+# Conversation IDs per IN (...) statement, under SQLite's historical
+# 999-parameter limit
+ID_BATCH_SIZE = 500
+
+
+@cache
+def _latest_flags_sql(id_count: int) -> str:
+    """
+    Build a statement marking the newest version of several conversations as latest.
+
+    The newest version of each row's conversation is found with a single
+    seek on (conversation_id, timestamp DESC). Rows whose flag is already
+    right are skipped, so re-syncing an unchanged conversation writes nothing
+    and fires no FTS triggers.
+
+    Args:
+        id_count: Number of conversation_id parameters
+
+    Returns:
+        SQL statement taking id_count conversation IDs
+    """
+    newest_version = """(
+        SELECT newest.version_id
+        FROM transcription_index newest
+        WHERE newest.conversation_id = transcription_index.conversation_id
+        ORDER BY newest.timestamp DESC
+        LIMIT 1
+    )"""
+    return f"""
+    UPDATE transcription_index
+    SET is_latest = (version_id = {newest_version})
+    WHERE conversation_id IN ({", ".join(["?"] * id_count)})
+      AND is_latest <> (version_id = {newest_version})
+    """
+
+
+@cache
+def _delete_sql(id_count: int) -> str:
+    """
+    Build a statement deleting every version of several conversations.
+
+    Args:
+        id_count: Number of conversation_id parameters
+
+    Returns:
+        SQL statement taking id_count conversation IDs
+    """
+    return f"""
+    DELETE FROM transcription_index
+    WHERE conversation_id IN ({", ".join(["?"] * id_count)})
+    """
+
+
+def _refresh_latest_flags(cursor: sqlite3.Cursor, conversation_ids: list[str]) -> None:
+    """
+    Mark the newest version of each conversation as latest and the rest as not.
+
+    Runs on the caller's transaction with one UPDATE per ID_BATCH_SIZE
+    conversations.
+
+    Args:
+        cursor: Cursor of an open write transaction
+        conversation_ids: Conversation identifiers
+    """
+    for start in range(0, len(conversation_ids), ID_BATCH_SIZE):
+        batch = conversation_ids[start:start + ID_BATCH_SIZE]
+        cursor.execute(_latest_flags_sql(len(batch)), batch)
+
+
+# Filters shared by the search statements; a NULL bound timestamp disables its filter
+_SEARCH_WHERE = """
+    WHERE transcription_fts MATCH :query
+      AND (:start_timestamp IS NULL OR ti.timestamp >= :start_timestamp)
+      AND (:end_timestamp IS NULL OR ti.timestamp <= :end_timestamp)
+"""
+
+SEARCH_COUNT_SQL = (
+    """
+    SELECT COUNT(DISTINCT ti.conversation_id)
+    FROM transcription_index ti
+    INNER JOIN transcription_fts fts ON ti.rowid = fts.rowid
+    """
+    + _SEARCH_WHERE
+)
+
+# Note: snippet() column indices: 0=conversation_id, 1=version_id, 2=title, 3=raw_transcription
+# The page is materialized first so each snippet is generated once; the outer
+# SELECT then drops snippets without a highlighted match and counts the
+# versions of the page's conversations only
+SEARCH_SQL = (
+    """
+    WITH page AS MATERIALIZED (
+        SELECT DISTINCT
+            ti.conversation_id,
+            ti.version_id,
+            ti.timestamp,
+            ti.title,
+            ti.audio_hash,
+            ti.duration,
+            ti.language,
+            ti.created_at,
+            snippet(transcription_fts, 2, '<mark>', '</mark>', '...', 32) as title_snippet,
+            snippet(transcription_fts, 3, '<mark>', '</mark>', '...', 64) as raw_snippet,
+            bm25(transcription_fts) as rank
+        FROM transcription_index ti
+        INNER JOIN transcription_fts fts ON ti.rowid = fts.rowid
+    """
+    + _SEARCH_WHERE
+    + """
+        ORDER BY rank, ti.timestamp DESC
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT
+        conversation_id,
+        version_id,
+        timestamp,
+        title,
+        audio_hash,
+        duration,
+        language,
+        created_at AS "created_at [TIMESTAMP]",
+        (
+            SELECT COUNT(*)
+            FROM transcription_index versions
+            WHERE versions.conversation_id = page.conversation_id
+        ) AS version_count,
+        CASE WHEN instr(title_snippet, '<mark>') > 0 THEN title_snippet END AS title_snippet,
+        CASE WHEN instr(raw_snippet, '<mark>') > 0 THEN raw_snippet END AS raw_snippet,
+        rank
+    FROM page
+    ORDER BY rank, timestamp DESC
+    """
+)
+
+def _to_fts_query(query: str) -> str:
+    """
+    Build an FTS5 MATCH expression for a user search query.
+
+    Each whitespace-separated term is quoted as an FTS5 string so punctuation
+    and operator keywords in user input are matched literally, and the terms
+    are OR-ed: a result needs any of them, and bm25 ranks results containing
+    more of them first. Only raw_transcription and title are searched to
+    avoid duplicate results from other versions; a column filter restricts
+    all terms to both columns in one pass over the postings.
+
+    Args:
+        query: Search query string
+
+    Returns:
+        FTS5 MATCH expression
+    """
+    # A blank query becomes one empty phrase, which matches nothing
+    terms = " OR ".join('"' + term.replace('"', '""') + '"' for term in query.split() or [""])
+    return f"{{title raw_transcription}}: ({terms})"
+
+
+def _list_where(has_start: bool, has_end: bool) -> str:
+    """
+    Build the WHERE clause of the latest-conversation listing.
+
+    Args:
+        has_start: Whether a start timestamp parameter is bound
+        has_end: Whether an end timestamp parameter is bound
+
+    Returns:
+        WHERE clause with positional placeholders for the given filters
+    """
+    where_clauses = ["is_latest = 1"]
+    if has_start:
+        where_clauses.append("timestamp >= ?")
+    if has_end:
+        where_clauses.append("timestamp <= ?")
+    return "WHERE " + " AND ".join(where_clauses)
+
+
+# Listing statements are built once per filter combination instead of per
+# request; the filters stay out of the SQL when unused so the
+# (is_latest, timestamp, conversation_id) index can seek on them
+@cache
+def _list_count_sql(has_start: bool, has_end: bool) -> str:
+    """
+    Build the count statement of the latest-conversation listing.
+
+    Args:
+        has_start: Whether a start timestamp parameter is bound
+        has_end: Whether an end timestamp parameter is bound
+
+    Returns:
+        SQL statement
+    """
+    # Each conversation has exactly one is_latest row, so COUNT(*) counts
+    # conversations without the temp B-tree COUNT(DISTINCT) needs
+    return f"""
+    SELECT COUNT(*)
+    FROM transcription_index
+    {_list_where(has_start, has_end)}
+    """
+
+
+@cache
+def _list_sql(has_start: bool, has_end: bool, has_before: bool) -> str:
+    """
+    Build the page statement of the latest-conversation listing.
+
+    conversation_id breaks timestamp ties so the order is stable and every
+    row has a unique seek position for keyset pagination. version_count is
+    only computed for the rows of the page, each with one range scan of the
+    (conversation_id, timestamp) index.
+
+    Args:
+        has_start: Whether a start timestamp parameter is bound
+        has_end: Whether an end timestamp parameter is bound
+        has_before: Whether a (timestamp, conversation_id) keyset is bound
+
+    Returns:
+        SQL statement taking the filter parameters, then LIMIT and OFFSET
+    """
+    where_clause = _list_where(has_start, has_end)
+    if has_before:
+        where_clause += " AND (timestamp, conversation_id) < (?, ?)"
+    return f"""
+    SELECT
+        conversation_id,
+        timestamp,
+        title,
+        created_at,
+        (
+            SELECT COUNT(*)
+            FROM transcription_index versions
+            WHERE versions.conversation_id = transcription_index.conversation_id
+        ) AS version_count
+    FROM transcription_index
+    {where_clause}
+    ORDER BY timestamp DESC, conversation_id DESC
+    LIMIT ? OFFSET ?
+    """
+
+
+# Shared by every repo instance so writes from IndexingService invalidate
+# the counts read by TranscriptionService
+_count_cache = _CountCache()
+
+
 class TranscriptionIndexRepo:
     """
     Repository for managing the transcription search index.
@@ -14,6 +435,20 @@ class TranscriptionIndexRepo:
     pagination support for loading transcriptions.
     """
 
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run a write transaction and invalidate cached counts afterwards.
+
+        Yields:
+            Cursor bound to the shared connection
+        """
+        try:
+            with transaction() as cursor:
+                yield cursor
+        finally:
+            _count_cache.invalidate()
+
     def upsert(
         self,
         conversation_id: str,
@@ -34,55 +469,36 @@ class TranscriptionIndexRepo:
             title: Conversation title
             is_latest: Whether this is the latest version
         """
-        conn = get_db()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO transcription_index (
-                conversation_id, version_id, timestamp, title,
-                raw_transcription, preprocessed_transcription, llm_transcription,
-                audio_hash, duration, language, model_name, language_model_name,
-                mode_name, created_at, is_latest, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(conversation_id, version_id) DO UPDATE SET
-                timestamp = excluded.timestamp,
-                title = excluded.title,
-                raw_transcription = excluded.raw_transcription,
-                preprocessed_transcription = excluded.preprocessed_transcription,
-                llm_transcription = excluded.llm_transcription,
-                audio_hash = excluded.audio_hash,
-                duration = excluded.duration,
-                language = excluded.language,
-                model_name = excluded.model_name,
-                language_model_name = excluded.language_model_name,
-                mode_name = excluded.mode_name,
-                created_at = excluded.created_at,
-                is_latest = excluded.is_latest,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (
-                conversation_id,
-                version_id,
-                timestamp,
-                title,
-                transcription.raw_transcription,
-                transcription.preprocessed_transcription,
-                transcription.llm_transcription,
-                transcription.audio_hash,
-                transcription.duration,
-                transcription.language,
-                transcription.model_name,
-                transcription.language_model_name,
-                transcription.mode_name,
-                transcription.created_at.isoformat() if transcription.created_at else None,
-                1 if is_latest else 0,
-            ),
+        self.upsert_many(
+            [(conversation_id, version_id, timestamp, transcription, title, is_latest)]
         )
 
-        conn.commit()
-        conn.close()
+    def upsert_many(
+        self,
+        rows: list[tuple[str, str, int, TranscriptionMetadata, str, bool]],
+        refresh_latest: bool = False,
+    ) -> None:
+        """
+        Insert or update several transcriptions in one transaction.
+
+        Args:
+            rows: (conversation_id, version_id, timestamp, transcription, title,
+                is_latest) tuples, as taken by upsert()
+            refresh_latest: Also recompute the is_latest flags of every
+                conversation in rows, as refresh_latest_flags() does, within
+                the same transaction
+        """
+        # Multi-row VALUES statements step the VDBE once per batch, not per row
+        with self._write() as cursor:
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                batch = rows[start:start + UPSERT_BATCH_SIZE]
+                cursor.execute(
+                    _upsert_sql(len(batch)),
+                    list(chain.from_iterable(_upsert_params(*row) for row in batch)),
+                )
+
+            if refresh_latest:
+                _refresh_latest_flags(cursor, list(dict.fromkeys(row[0] for row in rows)))
 
     def get_paginated_conversations(
         self,
@@ -90,74 +506,64 @@ class TranscriptionIndexRepo:
         page_size: int = 30,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-    ) -> tuple[list[dict], int]:
+        before: Optional[tuple[int, str]] = None,
+        lookahead: int = 0,
+    ) -> tuple[list[sqlite3.Row], int]:
         """
         Get paginated list of latest conversations.
 
+        Only the columns rendered in the conversation list are fetched. When
+        ``before`` is given the page is found by seeking the
+        (is_latest, timestamp, conversation_id) index instead of skipping
+        OFFSET rows, so deep pages cost the same as the first one.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when before is given
             page_size: Number of items per page
             start_timestamp: Optional start timestamp filter (Unix timestamp)
             end_timestamp: Optional end timestamp filter (Unix timestamp)
+            before: Optional (timestamp, conversation_id) of the last row of
+                the previous page
+            lookahead: Extra rows to fetch past the page, to tell whether
+                another page follows
 
         Returns:
-            Tuple of (list of conversation dicts, total count)
+            Tuple of (list of up to page_size + lookahead conversation rows,
+            total count)
         """
         conn = get_db()
         cursor = conn.cursor()
 
-        # Build WHERE clause with timestamp filters
-        where_clauses = ["is_latest = 1"]
         params = []
-
         if start_timestamp is not None:
-            where_clauses.append("timestamp >= ?")
             params.append(start_timestamp)
-
         if end_timestamp is not None:
-            where_clauses.append("timestamp <= ?")
             params.append(end_timestamp)
 
-        where_clause = " AND ".join(where_clauses)
-
-        # Get total count
-        cursor.execute(
-            f"""
-            SELECT COUNT(DISTINCT conversation_id)
-            FROM transcription_index
-            WHERE {where_clause}
-            """,
-            params,
-        )
-        total = cursor.fetchone()[0]
+        # Get total count, reusing the cached value until the index changes
+        count_key = ("latest", start_timestamp, end_timestamp)
+        total = _count_cache.get(count_key)
+        if total is None:
+            generation = _count_cache.generation
+            cursor.execute(
+                _list_count_sql(start_timestamp is not None, end_timestamp is not None), params
+            )
+            total = cursor.fetchone()[0]
+            _count_cache.store(count_key, total, generation)
 
         # Get paginated results
-        offset = (page - 1) * page_size
+        if before is not None:
+            params.extend(before)
+            offset = 0
+        else:
+            offset = (page - 1) * page_size
         cursor.execute(
-            f"""
-            SELECT
-                conversation_id,
-                version_id,
-                timestamp,
-                title,
-                audio_hash,
-                duration,
-                language,
-                created_at,
-                updated_at
-            FROM transcription_index
-            WHERE {where_clause}
-            ORDER BY timestamp DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [page_size, offset],
+            _list_sql(start_timestamp is not None, end_timestamp is not None, before is not None),
+            params + [page_size + lookahead, offset],
         )
 
-        rows = cursor.fetchall()
-        conn.close()
-
-        results = [dict(row) for row in rows]
-        return results, total
+        # sqlite3.Row already supports row["column"]; no per-row dict copy
+        return cursor.fetchall(), total
 
     def search(
         self,
@@ -166,7 +572,7 @@ class TranscriptionIndexRepo:
         page_size: int = 30,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchResult], int]:
         """
         Full-text search across transcriptions with pagination.
 
@@ -178,91 +584,49 @@ class TranscriptionIndexRepo:
             end_timestamp: Optional end timestamp filter (Unix timestamp)
 
         Returns:
-            Tuple of (list of search result dicts with highlights, total count)
+            Tuple of (list of search results with highlights, total count)
         """
         conn = get_db()
         cursor = conn.cursor()
 
-        # Prepare FTS5 query - search only raw_transcription and title
-        # This prevents duplicate results from different transcription versions
-        if " " in query:
-            # Phrase search - wrap in quotes
-            fts_query = f'raw_transcription:"{query}" OR title:"{query}"'
-        else:
-            # Word search
-            fts_query = f'raw_transcription:{query} OR title:{query}'
-
-        # Build WHERE clause with timestamp filters
-        where_clauses = ["transcription_fts MATCH ?"]
-        params = [fts_query]
-
-        if start_timestamp is not None:
-            where_clauses.append("ti.timestamp >= ?")
-            params.append(start_timestamp)
-
-        if end_timestamp is not None:
-            where_clauses.append("ti.timestamp <= ?")
-            params.append(end_timestamp)
-
-        where_clause = " AND ".join(where_clauses)
-
-        # Get total count of matching conversations
-        cursor.execute(
-            f"""
-            SELECT COUNT(DISTINCT ti.conversation_id)
-            FROM transcription_index ti
-            INNER JOIN transcription_fts fts ON ti.rowid = fts.rowid
-            WHERE {where_clause}
-            """,
-            params,
-        )
-        total = cursor.fetchone()[0]
+        # Constant SQL with bound parameters lets sqlite3 reuse the prepared
+        # statements instead of re-parsing and re-planning them per request.
+        # The MATCH expression is escaped once and shared by COUNT and SELECT,
+        # which run back to back on the shared connection
+        params = {
+            "query": _to_fts_query(query),
+            "start_timestamp": start_timestamp,
+            "end_timestamp": end_timestamp,
+        }
+
+        # Get total count of matching conversations, running the FTS match for
+        # it only once per query until the index changes, not once per page
+        count_key = ("search", params["query"], start_timestamp, end_timestamp)
+        total = _count_cache.get(count_key)
+        if total is None:
+            generation = _count_cache.generation
+            cursor.execute(SEARCH_COUNT_SQL, params)
+            total = cursor.fetchone()[0]
+            _count_cache.store(count_key, total, generation)
 
         # Get paginated search results with highlights
-        # Note: snippet() column indices: 0=conversation_id, 1=version_id, 2=title, 3=raw_transcription
-        offset = (page - 1) * page_size
-        cursor.execute(
-            f"""
-            SELECT DISTINCT
-                ti.conversation_id,
-                ti.version_id,
-                ti.timestamp,
-                ti.title,
-                ti.audio_hash,
-                ti.duration,
-                ti.language,
-                ti.created_at,
-                ti.updated_at,
-                snippet(transcription_fts, 2, '<mark>', '</mark>', '...', 32) as title_snippet,
-                snippet(transcription_fts, 3, '<mark>', '</mark>', '...', 64) as raw_snippet,
-                bm25(transcription_fts) as rank
-            FROM transcription_index ti
-            INNER JOIN transcription_fts fts ON ti.rowid = fts.rowid
-            WHERE {where_clause}
-            ORDER BY rank, ti.timestamp DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [page_size, offset],
-        )
-
-        rows = cursor.fetchall()
-        conn.close()
-
-        results = []
-        for row in rows:
-            result = dict(row)
-            # Collect non-empty snippets (only title and raw now)
-            snippets = []
-            for key in ["title_snippet", "raw_snippet"]:
-                snippet = result.pop(key, None)
-                if snippet and snippet.strip() and "<mark>" in snippet:
-                    snippets.append(snippet)
-            result["match_snippets"] = snippets[:3]  # Limit to 3 snippets
-            results.append(result)
+        params["limit"] = page_size
+        params["offset"] = (page - 1) * page_size
+        cursor.execute(SEARCH_SQL, params)
+
+        # Plain tuples are unpacked straight into SearchResult, skipping the
+        # sqlite3.Row wrapper and a dict copy per row
+        cursor.row_factory = None
+        results = [
+            SearchResult(
+                *columns, rank, [snippet for snippet in (title_snippet, raw_snippet) if snippet]
+            )
+            for *columns, title_snippet, raw_snippet, rank in cursor.fetchall()
+        ]
 
         return results, total
 
-    def get_by_conversation_id(self, conversation_id: str) -> list[dict]:
+    def get_by_conversation_id(self, conversation_id: str) -> list[sqlite3.Row]:
         """
         Get all versions of a conversation.
 
@@ -270,7 +634,7 @@ class TranscriptionIndexRepo:
             conversation_id: Conversation identifier
 
         Returns:
-            List of version dicts ordered by timestamp (newest first)
+            List of version rows ordered by timestamp (newest first)
         """
         conn = get_db()
         cursor = conn.cursor()
@@ -300,10 +664,7 @@ class TranscriptionIndexRepo:
             (conversation_id,),
         )
 
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        return cursor.fetchall()
 
     def update_latest_flags(self, conversation_id: str) -> None:
         """
@@ -313,37 +674,17 @@ class TranscriptionIndexRepo:
         Args:
             conversation_id: Conversation identifier
         """
-        conn = get_db()
-        cursor = conn.cursor()
-
-        # First, set all to 0
-        cursor.execute(
-            """
-            UPDATE transcription_index
-            SET is_latest = 0
-            WHERE conversation_id = ?
-            """,
-            (conversation_id,),
-        )
+        self.refresh_latest_flags([conversation_id])
 
-        # Then set the latest one to 1
-        cursor.execute(
-            """
-            UPDATE transcription_index
-            SET is_latest = 1
-            WHERE conversation_id = ? AND version_id = (
-                SELECT version_id
-                FROM transcription_index
-                WHERE conversation_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            )
-            """,
-            (conversation_id, conversation_id),
-        )
+    def refresh_latest_flags(self, conversation_ids: list[str]) -> None:
+        """
+        Update the is_latest flags of several conversations in one transaction.
 
-        conn.commit()
-        conn.close()
+        Args:
+            conversation_ids: Conversation identifiers
+        """
+        with self._write() as cursor:
+            _refresh_latest_flags(cursor, conversation_ids)
 
     def get_count(self) -> int:
         """
@@ -352,6 +693,12 @@ class TranscriptionIndexRepo:
         Returns:
             Count of unique conversations
         """
+        count_key = ("all",)
+        count = _count_cache.get(count_key)
+        if count is not None:
+            return count
+
+        generation = _count_cache.generation
         conn = get_db()
         cursor = conn.cursor()
 
@@ -363,7 +710,7 @@ class TranscriptionIndexRepo:
         )
 
         count = cursor.fetchone()[0]
-        conn.close()
+        _count_cache.store(count_key, count, generation)
 
         return count
 
@@ -374,26 +721,23 @@ class TranscriptionIndexRepo:
         Args:
             conversation_id: Conversation identifier
         """
-        conn = get_db()
-        cursor = conn.cursor()
+        self.delete_many([conversation_id])
 
-        cursor.execute(
-            """
-            DELETE FROM transcription_index
-            WHERE conversation_id = ?
-            """,
-            (conversation_id,),
-        )
+    def delete_many(self, conversation_ids: list[str]) -> None:
+        """
+        Delete all versions of several conversations in one transaction.
 
-        conn.commit()
-        conn.close()
+        Args:
+            conversation_ids: Conversation identifiers
+        """
+        with self._write() as cursor:
+            for start in range(0, len(conversation_ids), ID_BATCH_SIZE):
+                batch = conversation_ids[start:start + ID_BATCH_SIZE]
+                cursor.execute(_delete_sql(len(batch)), batch)
 
     def clear_all(self) -> None:
         """Clear all entries from the index."""
-        conn = get_db()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM transcription_index")
-
-        conn.commit()
-        conn.close()
+        try:
+            clear_index()
+        finally:
+            _count_cache.invalidate()
@@ -1,19 +1,30 @@
-"""Pydantic schemas for transcription API."""
+"""Response schemas for transcription API.
 
+Schemas are slotted, frozen dataclasses: responses are built from trusted,
+already indexed data, so they skip Pydantic validation and are serialized
+directly with orjson. Pydantic ``Field`` metadata is kept for the OpenAPI docs.
+"""
+
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+from typing_extensions import TypedDict
 
 
-class TimecodeEntry(BaseModel):
+# A TypedDict rather than a dataclass, so normalized repository segments
+# can be returned as-is without building a new object per segment
+class TimecodeEntry(TypedDict):
     """Single timecode entry with text."""
 
-    start_time: float = Field(..., description="Start time in seconds")
-    end_time: float = Field(..., description="End time in seconds")
-    text: str = Field(..., description="Transcribed text for this time range")
+    start_time: Annotated[float, Field(description="Start time in seconds")]
+    end_time: Annotated[float, Field(description="End time in seconds")]
+    text: Annotated[str, Field(description="Transcribed text for this time range")]
 
 
-class TranscriptionMetadataSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TranscriptionMetadataSchema:
     """Schema for transcription metadata."""
 
     timestamp: int
@@ -26,7 +37,8 @@ class TranscriptionMetadataSchema(BaseModel):
     created_at: datetime | None = None
 
 
-class AudioVersionSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AudioVersionSchema:
     """Schema for audio version/attempt."""
 
     version_id: str
@@ -35,7 +47,8 @@ class AudioVersionSchema(BaseModel):
     is_latest: bool = False
 
 
-class ConversationSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConversationSchema:
     """Schema for conversation."""
 
     conversation_id: str
@@ -46,7 +59,8 @@ class ConversationSchema(BaseModel):
     updated_at: datetime | None = None
 
 
-class ConversationListItemSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConversationListItemSchema:
     """Schema for conversation list item (summary)."""
 
     conversation_id: str
@@ -57,38 +71,46 @@ class ConversationListItemSchema(BaseModel):
     updated_at: datetime | None = None
 
 
-class SearchResultSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SearchResultSchema:
     """Schema for search results."""
 
     conversation_id: str
     title: str
-    matches: list[str] = Field(
-        ..., description="Text snippets matching the search query"
-    )
+    matches: Annotated[list[str], Field(description="Text snippets matching the search query")]
     latest_timestamp: int
     version_count: int
 
 
-class PaginationMetadata(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PaginationMetadata:
     """Pagination metadata for paginated responses."""
 
-    page: int = Field(..., description="Current page number (1-indexed)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
-    has_next: bool = Field(..., description="Whether there is a next page")
-    has_prev: bool = Field(..., description="Whether there is a previous page")
+    page: Annotated[int, Field(description="Current page number (1-indexed)")]
+    page_size: Annotated[int, Field(description="Number of items per page")]
+    total_items: Annotated[int, Field(description="Total number of items")]
+    total_pages: Annotated[int, Field(description="Total number of pages")]
+    has_next: Annotated[bool, Field(description="Whether there is a next page")]
+    has_prev: Annotated[bool, Field(description="Whether there is a previous page")]
+    next_cursor: Annotated[
+        str | None,
+        Field(description="Cursor for the next page, when the endpoint supports cursors"),
+    ] = None
 
 
-class PaginatedConversationListResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PaginatedConversationListResponse:
     """Paginated response for conversation list."""
 
-    items: list[ConversationListItemSchema] = Field(..., description="List of conversations")
-    pagination: PaginationMetadata = Field(..., description="Pagination metadata")
+    items: Annotated[
+        list[ConversationListItemSchema], Field(description="List of conversations")
+    ]
+    pagination: Annotated[PaginationMetadata, Field(description="Pagination metadata")]
 
 
-class PaginatedSearchResultResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PaginatedSearchResultResponse:
     """Paginated response for search results."""
 
-    items: list[SearchResultSchema] = Field(..., description="List of search results")
-    pagination: PaginationMetadata = Field(..., description="Pagination metadata")
+    items: Annotated[list[SearchResultSchema], Field(description="List of search results")]
+    pagination: Annotated[PaginationMetadata, Field(description="Pagination metadata")]
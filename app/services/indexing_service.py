@@ -2,14 +2,41 @@
 
 import asyncio
 import logging
+import os
+from itertools import islice
+from pathlib import Path
 from typing import Optional
 
-from app.models.transcription import Conversation, TranscriptionMetadata
+from app.db import maybe_analyze, rebuild_fts, suspend_fts_sync
+from app.models.transcription import Conversation, iter_conversations
 from app.repositories.base import TranscriptionRepository
+from app.repositories.superwhisper import is_timestamp_name
 from app.repositories.transcription_index import TranscriptionIndexRepo
 
 logger = logging.getLogger(__name__)
 
+# Conversations indexed per write transaction during a sync
+SYNC_BATCH_SIZE = 1000
+
+# Sync progress is logged once this many versions are indexed, then each
+# time the count doubles
+PROGRESS_LOG_START = SYNC_BATCH_SIZE
+
+
+def _count_timestamp_directories(base_dir: Path) -> int:
+    """
+    Count the timestamp-named subdirectories of a directory.
+
+    Args:
+        base_dir: Directory to scan
+
+    Returns:
+        Number of directories with timestamp names
+    """
+    # DirEntry.is_dir() uses the dirent type, so no stat per entry
+    with os.scandir(base_dir) as it:
+        return sum(1 for entry in it if is_timestamp_name(entry.name) and entry.is_dir())
+
 
 class IndexingService:
     """
@@ -34,8 +61,12 @@ class IndexingService:
         self.transcription_repo = transcription_repo
         self.index_repo = index_repo or TranscriptionIndexRepo()
         self._sync_task: Optional[asyncio.Task] = None
-        self._is_syncing = False
+        # Held for the whole of a sync, including ensure_sync's staleness check,
+        # so concurrent callers can't start overlapping full scans
+        self._sync_lock = asyncio.Lock()
         self._sync_complete = False
+        # Base directory mtime when the index was last known to be in sync
+        self._synced_mtime: Optional[int] = None
 
     async def start_background_sync(self) -> None:
         """
@@ -50,6 +81,22 @@ class IndexingService:
         logger.info("Starting background sync task")
         self._sync_task = asyncio.create_task(self._sync_all_transcriptions())
 
+    async def stop(self) -> None:
+        """
+        Cancel the background sync task, if running, and wait for it to finish.
+
+        Call this on shutdown before the database connection and the hash
+        executor are released, so an in-flight sync doesn't outlive them.
+        """
+        if self._sync_task is None or self._sync_task.done():
+            return
+
+        logger.info("Stopping background sync task")
+        self._sync_task.cancel()
+        # return_exceptions collects the task's CancelledError, while a
+        # cancellation of stop() itself still propagates
+        await asyncio.gather(self._sync_task, return_exceptions=True)
+
     async def wait_for_sync(self, timeout: float = 30.0) -> bool:
         """
         Wait for the background sync to complete.
@@ -75,7 +122,7 @@ class IndexingService:
 
     def is_syncing(self) -> bool:
         """Check if sync is currently in progress."""
-        return self._is_syncing
+        return self._sync_lock.locked()
 
     def is_sync_complete(self) -> bool:
         """Check if initial sync has completed."""
@@ -95,19 +142,20 @@ class IndexingService:
             True if sync was performed, False if skipped
         """
         # Skip if already syncing
-        if self._is_syncing:
+        if self._sync_lock.locked():
             logger.debug("Sync already in progress, skipping ensure_sync")
             return False
 
-        # Check if sync is needed
-        if not force:
-            needs_sync = await self._check_sync_needed()
-            if not needs_sync:
-                logger.debug("Index is up-to-date, skipping sync")
-                return False
+        async with self._sync_lock:
+            # Check if sync is needed
+            if not force:
+                needs_sync = await self._check_sync_needed()
+                if not needs_sync:
+                    logger.debug("Index is up-to-date, skipping sync")
+                    return False
 
-        logger.info("Index out of sync, triggering re-sync")
-        await self._sync_all_transcriptions()
+            logger.info("Index out of sync, triggering re-sync")
+            await self._run_sync()
         return True
 
     async def _check_sync_needed(self) -> bool:
@@ -118,20 +166,18 @@ class IndexingService:
             True if sync is needed, False if index is up-to-date
         """
         try:
-            # Count directories in file system
-            from pathlib import Path
             base_dir = self.transcription_repo.base_directory
-            if not base_dir.exists():
+            base_mtime = self._base_directory_mtime()
+            if base_mtime is None:
+                return False
+
+            # The mtime changes whenever a recording directory is added or
+            # removed, so one stat replaces counting the directories
+            if base_mtime == self._synced_mtime:
                 return False
 
-            dir_count = 0
-            for subdir in base_dir.iterdir():
-                if subdir.is_dir():
-                    try:
-                        int(subdir.name)
-                        dir_count += 1
-                    except ValueError:
-                        continue
+            # Count directories in file system
+            dir_count = await asyncio.to_thread(_count_timestamp_directories, base_dir)
 
             # Count indexed conversations in database
             db_count = self.index_repo.get_count()
@@ -139,7 +185,11 @@ class IndexingService:
             logger.debug(f"Sync check: {dir_count} directories vs {db_count} indexed conversations")
 
             # Need sync if counts don't match
-            return dir_count != db_count
+            if dir_count != db_count:
+                return True
+
+            self._synced_mtime = base_mtime
+            return False
 
         except Exception as e:
             logger.error(f"Error checking sync status: {e}", exc_info=True)
@@ -147,180 +197,117 @@ class IndexingService:
             return True
 
     async def _sync_all_transcriptions(self) -> None:
+        """Sync all transcriptions, waiting for any sync already in progress."""
+        async with self._sync_lock:
+            await self._run_sync()
+
+    async def _run_sync(self) -> None:
         """
         Sync all transcriptions from file system to search index.
 
-        This method:
+        Must be called with _sync_lock held. This method:
         1. Loads all transcriptions from the file system
         2. Groups them into conversations
-        3. Indexes each conversation and version into the search database
+        3. Indexes each conversation and version into the search database,
+           skipping versions that are already indexed unchanged
+        4. On a first (bulk) load, rebuilds the FTS5 index in one pass
+           instead of syncing it per row
+        5. Refreshes query planner statistics if the index grew materially
         """
+        # An empty index is filled in bulk and its FTS index rebuilt once.
+        # Otherwise unchanged versions are skipped by the upsert, so the live
+        # triggers only have to sync the few rows that did change
+        bulk_load = self.index_repo.get_count() == 0
         try:
-            self._is_syncing = True
             logger.info("Starting transcription sync")
+            # Taken before loading, so directories added mid-sync trigger another one
+            base_mtime = self._base_directory_mtime()
+            if bulk_load:
+                suspend_fts_sync()
 
             # Get all transcriptions from the repository
             transcriptions = await self.transcription_repo.get_all_transcriptions()
             logger.info(f"Found {len(transcriptions)} transcriptions to index")
 
-            # Group transcriptions into conversations
-            conversations = self._group_transcriptions_into_conversations(transcriptions)
-            logger.info(f"Grouped into {len(conversations)} conversations")
+            # Group transcriptions into conversations. Order doesn't matter
+            # for indexing, so they are built lazily and each chunk can be
+            # freed once indexed
+            conversations = iter_conversations(transcriptions)
 
-            # Index each conversation
+            # Index conversations in chunks, one transaction per chunk
             indexed_count = 0
-            for conversation in conversations:
-                await self._index_conversation(conversation)
-                indexed_count += 1
-
-                # Log progress every 100 conversations
-                if indexed_count % 100 == 0:
-                    logger.info(f"Indexed {indexed_count}/{len(conversations)} conversations")
+            indexed_versions = 0
+            next_log_milestone = PROGRESS_LOG_START
+            while batch := list(islice(conversations, SYNC_BATCH_SIZE)):
+                self._index_conversations(batch)
+                indexed_count += len(batch)
+                # Let requests run between write transactions
+                await asyncio.sleep(0)
+                indexed_versions += sum(len(conv.versions) for conv in batch)
+                if indexed_versions >= next_log_milestone:
+                    while next_log_milestone <= indexed_versions:
+                        next_log_milestone *= 2
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Indexed %d/%d transcriptions", indexed_versions, len(transcriptions)
+                        )
 
             logger.info(f"Sync complete: indexed {indexed_count} conversations")
             self._sync_complete = True
+            self._synced_mtime = base_mtime
 
         except Exception as e:
             logger.error(f"Error during sync: {e}", exc_info=True)
             raise
         finally:
-            self._is_syncing = False
+            if bulk_load:
+                rebuild_fts()
 
-    async def _index_conversation(self, conversation: Conversation) -> None:
-        """
-        Index a single conversation and all its versions.
+        if maybe_analyze():
+            logger.info("Refreshed query planner statistics")
 
-        Args:
-            conversation: Conversation to index
+    def _base_directory_mtime(self) -> Optional[int]:
         """
-        try:
-            # Index each version
-            for version in conversation.versions:
-                title = self._generate_title(version.transcription)
-                self.index_repo.upsert(
-                    conversation_id=conversation.conversation_id,
-                    version_id=version.version_id,
-                    timestamp=version.timestamp,
-                    transcription=version.transcription,
-                    title=title,
-                    is_latest=version.is_latest,
-                )
-
-            # Update is_latest flags to ensure only the latest version is marked
-            self.index_repo.update_latest_flags(conversation.conversation_id)
-
-        except Exception as e:
-            logger.error(
-                f"Error indexing conversation {conversation.conversation_id}: {e}",
-                exc_info=True,
-            )
-
-    def _group_transcriptions_into_conversations(
-        self, transcriptions: list[TranscriptionMetadata]
-    ) -> list[Conversation]:
-        """
-        Group transcriptions into conversations.
-
-        This mirrors the logic from TranscriptionService to ensure consistency.
-
-        Args:
-            transcriptions: List of transcription metadata
+        Get the mtime of the transcription base directory.
 
         Returns:
-            List of conversations
+            mtime in nanoseconds, or None if the directory doesn't exist
         """
-        from app.models.transcription import AudioVersion, Conversation
-        from datetime import datetime
-
-        conversation_groups: dict[str, list[TranscriptionMetadata]] = {}
-
-        for trans in transcriptions:
-            conv_id = self._generate_conversation_id(trans)
-            if conv_id not in conversation_groups:
-                conversation_groups[conv_id] = []
-            conversation_groups[conv_id].append(trans)
-
-        conversations: list[Conversation] = []
-        for conv_id, trans_list in conversation_groups.items():
-            # Sort by timestamp (newest first)
-            trans_list.sort(key=lambda x: x.timestamp, reverse=True)
-
-            # Create versions
-            versions: list[AudioVersion] = []
-            for idx, trans in enumerate(trans_list):
-                is_latest = idx == 0
-                version = AudioVersion(
-                    version_id=str(trans.timestamp),
-                    timestamp=trans.timestamp,
-                    transcription=trans,
-                    is_latest=is_latest,
-                )
-                versions.append(version)
-
-            # Create conversation
-            latest_version = versions[0] if versions else None
-            title = self._generate_title(trans_list[0])
-
-            conversation = Conversation(
-                conversation_id=conv_id,
-                title=title,
-                versions=versions,
-                latest_version=latest_version,
-                created_at=trans_list[-1].created_at if trans_list else None,
-                updated_at=trans_list[0].created_at if trans_list else None,
-            )
-            conversations.append(conversation)
-
-        # Sort by most recent update
-        conversations.sort(
-            key=lambda x: x.updated_at or datetime.min,
-            reverse=True,
-        )
-
-        return conversations
-
-    def _generate_conversation_id(self, transcription: TranscriptionMetadata) -> str:
-        """
-        Generate a unique conversation ID.
-
-        Uses audio hash to group re-processed versions of the same recording.
-
-        Args:
-            transcription: Transcription metadata
-
-        Returns:
-            Conversation ID
-        """
-        if transcription.audio_hash:
-            return transcription.audio_hash
-        return str(transcription.timestamp)
+        try:
+            return self.transcription_repo.base_directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
-    def _generate_title(self, transcription: TranscriptionMetadata) -> str:
+    def _index_conversations(self, conversations: list[Conversation]) -> None:
         """
-        Generate a title for the conversation.
+        Index several conversations and all their versions in one transaction.
 
         Args:
-            transcription: Transcription metadata
-
-        Returns:
-            Conversation title
+            conversations: Conversations to index
         """
-        from datetime import datetime
-
-        text = (
-            transcription.llm_transcription
-            or transcription.raw_transcription
-            or transcription.preprocessed_transcription
-            or transcription.transcription_text
-        )
-
-        if text:
-            text = text.strip()
-            if len(text) > 50:
-                return text[:50] + "..."
-            return text
-
-        if transcription.created_at:
-            return transcription.created_at.strftime("Conversation on %Y-%m-%d %H:%M:%S")
+        try:
+            # is_latest flags are recomputed in the same transaction, so only
+            # the newest version is marked even if older ones were indexed
+            # by a previous sync
+            self.index_repo.upsert_many(
+                [
+                    (
+                        conversation.conversation_id,
+                        version.version_id,
+                        version.timestamp,
+                        version.transcription,
+                        version.transcription.title_preview,
+                        version.is_latest,
+                    )
+                    for conversation in conversations
+                    for version in conversation.versions
+                ],
+                refresh_latest=True,
+            )
 
-        return f"Conversation {transcription.timestamp}"
+        except Exception as e:
+            logger.error(
+                f"Error indexing {len(conversations)} conversations starting at "
+                f"{conversations[0].conversation_id}: {e}",
+                exc_info=True,
+            )
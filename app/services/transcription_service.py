@@ -1,16 +1,34 @@
 """Service layer for transcription business logic."""
 
-import hashlib
+import asyncio
 import logging
-from datetime import datetime
+import sqlite3
+import time
+from collections import OrderedDict
+from operator import attrgetter
 from typing import Optional
 
-from app.models.transcription import AudioVersion, Conversation, TranscriptionMetadata
+from app.models.transcription import (
+    Conversation,
+    TranscriptionMetadata,
+    build_conversation,
+    group_transcriptions,
+)
 from app.repositories.base import TranscriptionRepository
-from app.repositories.transcription_index import TranscriptionIndexRepo
+from app.repositories.superwhisper import is_timestamp_name
+from app.repositories.transcription_index import SearchResult, TranscriptionIndexRepo
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of assembled conversations kept by get_conversation_by_id
+CONVERSATION_CACHE_SIZE = 512
+
+# Seconds an assembled conversation is reused while the base directory's mtime
+# is unchanged. New recordings change the mtime; the age limit picks up
+# versions whose files are still being written. A version's meta.json rewritten
+# in place leaves the base mtime alone, so it shows up only after this long.
+CONVERSATION_CACHE_TTL = 30.0
+
 
 class TranscriptionService:
     """Service for managing transcription business logic."""
@@ -29,27 +47,48 @@ class TranscriptionService:
         """
         self.repository = repository
         self.index_repo = index_repo or TranscriptionIndexRepo()
+        # Transcriptions last grouped by get_all_conversations, and the result
+        self._grouped_cache: tuple[list[TranscriptionMetadata], list[Conversation]] | None = None
+        # conversation_id -> (base directory mtime, load time, conversation)
+        self._conversation_cache: OrderedDict[
+            str, tuple[Optional[int], float, Conversation]
+        ] = OrderedDict()
 
     async def get_all_conversations(self) -> list[Conversation]:
         """
         Get all conversations grouped from transcriptions.
 
         This method groups related transcriptions (re-transcriptions of the same audio)
-        into conversations with multiple versions.
+        into conversations with multiple versions. The grouping is reused while
+        the repository returns the same transcriptions.
 
         Returns:
             List of conversations
         """
         transcriptions = await self.repository.get_all_transcriptions()
-        conversations = self._group_transcriptions_into_conversations(transcriptions)
-        return conversations
+
+        # Repositories hand out the same metadata objects while nothing changed,
+        # so the list comparison is mostly identity checks
+        if self._grouped_cache is not None:
+            grouped_transcriptions, conversations = self._grouped_cache
+            if grouped_transcriptions == transcriptions:
+                return list(conversations)
+
+        conversations = group_transcriptions(transcriptions)
+        self._grouped_cache = (transcriptions, conversations)
+        return list(conversations)
 
     async def get_conversation_by_id(self, conversation_id: str) -> Conversation | None:
         """
         Get a specific conversation by ID without loading all conversations.
 
         This method ONLY loads the specific conversation requested using the cache.
-        It never falls back to loading all conversations.
+        It never falls back to loading all conversations. Recently assembled
+        conversations are reused for up to CONVERSATION_CACHE_TTL seconds while
+        the base directory's mtime is unchanged, so edits to an existing
+        version's files may be served stale for that long. At most
+        CONVERSATION_CACHE_SIZE conversations are kept, least recently used
+        first out.
 
         Args:
             conversation_id: Conversation identifier (audio_hash or recording_id/timestamp)
@@ -67,139 +106,97 @@ class TranscriptionService:
                     return conv
             return None
 
-        # Strategy 1: Try as audio_hash (most common case - groups multiple versions)
-        matching_entries = self.repository._cache.get_by_audio_hash(conversation_id)
-        if matching_entries:
-            logger.debug(f"Found {len(matching_entries)} version(s) for audio_hash {conversation_id}")
-
-            # Load all transcriptions for this conversation
-            transcriptions = []
-            for entry in matching_entries:
-                timestamp = int(entry["internal_id"])
-                transcription = await self.repository.get_transcription_by_timestamp(timestamp)
-                if transcription:
-                    transcriptions.append(transcription)
-
-            if transcriptions:
-                # Build complete conversation from all versions
-                conversations = self._group_transcriptions_into_conversations(transcriptions)
-                if conversations:
-                    logger.debug(f"Built conversation from {len(transcriptions)} version(s)")
-                    return conversations[0]
-
-        # Strategy 2: Try as recording_id (timestamp or recordingId)
-        cache_entry = self.repository._cache.get_by_recording_id(conversation_id)
-        if cache_entry:
-            logger.debug(f"Found cache entry for recording_id: {conversation_id}")
-            audio_hash = cache_entry.get("audio_hash")
-
-            # If this entry has an audio_hash, load all versions with that hash
-            if audio_hash:
-                logger.debug(f"Recording has audio_hash {audio_hash}, loading all versions")
-                # Use Strategy 1 to get all versions
-                return await self.get_conversation_by_id(audio_hash)
-
-            # No audio_hash means standalone recording
-            logger.debug("No audio_hash, loading as standalone recording")
-            timestamp = int(cache_entry["internal_id"])
-            transcription = await self.repository.get_transcription_by_timestamp(timestamp)
-            if transcription:
-                conversations = self._group_transcriptions_into_conversations([transcription])
-                if conversations:
-                    return conversations[0]
-
-        # Strategy 3: Try as internal_id (timestamp)
-        cache_entry = self.repository._cache.get_by_internal_id(conversation_id)
-        if cache_entry:
-            logger.debug(f"Found cache entry for internal_id: {conversation_id}")
-            timestamp = int(cache_entry["internal_id"])
-            transcription = await self.repository.get_transcription_by_timestamp(timestamp)
+        base_mtime = self._base_directory_mtime()
+        cached = self._conversation_cache.get(conversation_id)
+        if cached is not None:
+            cached_mtime, loaded_at, conversation = cached
+            age = time.monotonic() - loaded_at
+            if cached_mtime == base_mtime and age < CONVERSATION_CACHE_TTL:
+                self._conversation_cache.move_to_end(conversation_id)
+                return conversation
+            del self._conversation_cache[conversation_id]
+
+        version_entries, standalone_timestamp = self._resolve_conversation(conversation_id)
+
+        # Load every version of the conversation (concurrently), or the
+        # standalone recording
+        transcriptions = []
+        if version_entries:
+            logger.debug(f"Found {len(version_entries)} version(s) for {conversation_id}")
+            loaded = await asyncio.gather(
+                *(
+                    self.repository.get_transcription_by_timestamp(int(entry["internal_id"]))
+                    for entry in version_entries
+                )
+            )
+            transcriptions = [transcription for transcription in loaded if transcription]
+        elif standalone_timestamp is not None:
+            logger.debug(f"Loading {conversation_id} as standalone recording")
+            transcription = await self.repository.get_transcription_by_timestamp(
+                standalone_timestamp
+            )
             if transcription:
-                # Check if this has an audio_hash to load all versions
-                if transcription.audio_hash:
-                    return await self.get_conversation_by_id(transcription.audio_hash)
-                # Standalone
-                conversations = self._group_transcriptions_into_conversations([transcription])
-                if conversations:
-                    return conversations[0]
+                transcriptions.append(transcription)
+
+        if transcriptions:
+            # The transcriptions form one conversation, so only order them
+            transcriptions.sort(key=attrgetter("timestamp"), reverse=True)
+            conversation = build_conversation(transcriptions[0].conversation_key, transcriptions)
+
+            self._conversation_cache[conversation_id] = (base_mtime, time.monotonic(), conversation)
+            if len(self._conversation_cache) > CONVERSATION_CACHE_SIZE:
+                self._conversation_cache.popitem(last=False)
+            return conversation
 
         logger.warning(f"Conversation not found: {conversation_id}")
         return None
 
-    async def search_conversations(self, query: str) -> list[tuple[Conversation, list[str]]]:
+    def _base_directory_mtime(self) -> Optional[int]:
+        """
+        Get the mtime of the transcription base directory.
+
+        Returns:
+            mtime in nanoseconds, or None if the directory doesn't exist
+        """
+        try:
+            return self.repository.base_directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _resolve_conversation(
+        self, conversation_id: str
+    ) -> tuple[list[sqlite3.Row], Optional[int]]:
         """
-        Search for conversations matching a query.
+        Resolve a conversation ID to its recordings using the repository cache.
+
+        The ID is tried as an audio hash (grouping multiple versions), then as
+        a recording ID, then as an internal ID (timestamp). A recording with an
+        audio hash resolves to every version sharing that hash.
 
         Args:
-            query: Search query string
+            conversation_id: Conversation identifier (audio_hash or recording_id/timestamp)
 
         Returns:
-            List of tuples (Conversation, list of matching text snippets)
+            Tuple of (cache entries of the conversation's versions, timestamp of
+            a standalone recording); both are empty/None if nothing matches
         """
-        conversations = await self.get_all_conversations()
-        results: list[tuple[Conversation, list[str]]] = []
-
-        query_lower = query.lower()
-
-        for conversation in conversations:
-            matches: list[str] = []
-
-            # Search in title
-            if query_lower in conversation.title.lower():
-                matches.append(f"Title: {conversation.title}")
-
-            # Search in all versions' transcriptions
-            for version in conversation.versions:
-                trans = version.transcription
-
-                # Search in raw transcription
-                if trans.raw_transcription and query_lower in trans.raw_transcription.lower():
-                    text = trans.raw_transcription
-                    match_contexts = self._extract_match_contexts(text, query, context_chars=100)
-                    matches.extend([f"Raw: {ctx}" for ctx in match_contexts])
-
-                # Search in preprocessed transcription
-                if (
-                    trans.preprocessed_transcription
-                    and query_lower in trans.preprocessed_transcription.lower()
-                ):
-                    text = trans.preprocessed_transcription
-                    match_contexts = self._extract_match_contexts(text, query, context_chars=100)
-                    matches.extend([f"Preprocessed: {ctx}" for ctx in match_contexts])
-
-                # Search in LLM transcription
-                if trans.llm_transcription and query_lower in trans.llm_transcription.lower():
-                    match_contexts = self._extract_match_contexts(
-                        trans.llm_transcription, query, context_chars=100
-                    )
-                    matches.extend([f"LLM: {ctx}" for ctx in match_contexts])
-
-                # Search in legacy fields for backward compatibility
-                if trans.transcription_text and query_lower in trans.transcription_text.lower():
-                    # Skip if already covered by the new fields
-                    if not (
-                        trans.raw_transcription
-                        or trans.preprocessed_transcription
-                        or trans.llm_transcription
-                    ):
-                        text = trans.transcription_text
-                        match_contexts = self._extract_match_contexts(
-                            text, query, context_chars=100
-                        )
-                        matches.extend(match_contexts)
-
-                if trans.llm_output and query_lower in trans.llm_output.lower():
-                    # Skip if already covered by llm_transcription
-                    if not trans.llm_transcription:
-                        match_contexts = self._extract_match_contexts(
-                            trans.llm_output, query, context_chars=100
-                        )
-                        matches.extend([f"LLM: {ctx}" for ctx in match_contexts])
-
-            if matches:
-                results.append((conversation, matches))
-
-        return results
+        cache = self.repository._cache
+
+        version_entries = cache.get_by_audio_hash(conversation_id)
+        if version_entries:
+            return version_entries, None
+
+        cache_entry = cache.get_by_recording_id(conversation_id) or cache.get_by_internal_id(
+            conversation_id
+        )
+        if cache_entry is None:
+            return [], None
+
+        audio_hash = cache_entry["audio_hash"]
+        if audio_hash:
+            return cache.get_by_audio_hash(audio_hash), None
+
+        return [], int(cache_entry["internal_id"])
 
     async def get_paginated_conversations(
         self,
@@ -207,26 +204,34 @@ class TranscriptionService:
         page_size: int = 30,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-    ) -> tuple[list[dict], int]:
+        before: Optional[tuple[int, str]] = None,
+        lookahead: int = 0,
+    ) -> tuple[list[sqlite3.Row], int]:
         """
         Get paginated list of conversations using the search index.
 
         This is much faster than loading all conversations as it uses the SQLite index.
 
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when before is given
             page_size: Number of items per page
             start_timestamp: Optional start timestamp filter (Unix timestamp)
             end_timestamp: Optional end timestamp filter (Unix timestamp)
+            before: Optional (timestamp, conversation_id) of the last row of
+                the previous page, for keyset pagination
+            lookahead: Extra rows to fetch past the page, to tell whether
+                another page follows
 
         Returns:
-            Tuple of (list of conversation dicts, total count)
+            Tuple of (list of conversation rows, total count)
         """
         return self.index_repo.get_paginated_conversations(
             page=page,
             page_size=page_size,
             start_timestamp=start_timestamp,
             end_timestamp=end_timestamp,
+            before=before,
+            lookahead=lookahead,
         )
 
     async def search_conversations_paginated(
@@ -236,7 +241,7 @@ class TranscriptionService:
         page_size: int = 30,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchResult], int]:
         """
         Search conversations with pagination using FTS5.
 
@@ -250,7 +255,7 @@ class TranscriptionService:
             end_timestamp: Optional end timestamp filter (Unix timestamp)
 
         Returns:
-            Tuple of (list of search result dicts with highlights, total count)
+            Tuple of (list of search results with highlights, total count)
         """
         return self.index_repo.search(
             query=query,
@@ -260,6 +265,24 @@ class TranscriptionService:
             end_timestamp=end_timestamp,
         )
 
+    async def get_segments(
+        self, transcriptions: list[TranscriptionMetadata]
+    ) -> list[list[dict[str, str | float]] | None]:
+        """
+        Load the timecode segments of several transcriptions concurrently.
+
+        Args:
+            transcriptions: Transcriptions to load segments for
+
+        Returns:
+            Segments of each transcription in the given order, None where there are none
+        """
+        return list(
+            await asyncio.gather(
+                *(self.repository.load_segments(transcription) for transcription in transcriptions)
+            )
+        )
+
     async def get_audio_file(self, conversation_id: str, version_id: str) -> bytes:
         """
         Get audio file for a specific conversation version.
@@ -274,23 +297,8 @@ class TranscriptionService:
         Raises:
             FileNotFoundError: If conversation or version not found
         """
-        conversation = await self.get_conversation_by_id(conversation_id)
-        if not conversation:
-            raise FileNotFoundError(f"Conversation {conversation_id} not found")
-
-        # Find the specific version
-        version = None
-        for v in conversation.versions:
-            if v.version_id == version_id:
-                version = v
-                break
-
-        if not version:
-            raise FileNotFoundError(
-                f"Version {version_id} not found in conversation {conversation_id}"
-            )
-
-        return await self.repository.read_audio_file(version.transcription)
+        transcription = await self._get_version_transcription(conversation_id, version_id)
+        return await self.repository.read_audio_file(transcription)
 
     async def get_audio_file_path(self, conversation_id: str, version_id: str) -> str:
         """
@@ -306,200 +314,61 @@ class TranscriptionService:
         Raises:
             FileNotFoundError: If conversation or version not found
         """
-        conversation = await self.get_conversation_by_id(conversation_id)
-        if not conversation:
-            raise FileNotFoundError(f"Conversation {conversation_id} not found")
-
-        # Find the specific version
-        version = None
-        for v in conversation.versions:
-            if v.version_id == version_id:
-                version = v
-                break
-
-        if not version:
-            raise FileNotFoundError(
-                f"Version {version_id} not found in conversation {conversation_id}"
-            )
-
-        if not version.transcription.audio_file:
+        # Paths resolved while indexing or by earlier requests skip reloading
+        # (and re-hashing) every version of the conversation
+        cached_path = self.repository.get_cached_audio_file_path(conversation_id, version_id)
+        if cached_path is not None:
+            return str(cached_path)
+
+        transcription = await self._get_version_transcription(conversation_id, version_id)
+        if not transcription.audio_file:
             raise FileNotFoundError(
                 f"No audio file found for version {version_id}"
             )
 
-        return str(version.transcription.audio_file)
-
-    def _group_transcriptions_into_conversations(
-        self, transcriptions: list[TranscriptionMetadata]
-    ) -> list[Conversation]:
-        """
-        Group transcriptions into conversations.
-
-        Strategy:
-        - For now, group by audio content similarity or metadata hints
-        - Each unique recording becomes a conversation
-        - Re-transcriptions of the same audio become versions within that conversation
-
-        TODO: Enhance grouping logic based on actual Superwhisper patterns
-
-        Args:
-            transcriptions: List of transcription metadata
-
-        Returns:
-            List of conversations
-        """
-        # Group transcriptions by conversation
-        # For now, each transcription is its own conversation
-        # This will be enhanced when we understand the re-transcription pattern
-        conversation_groups: dict[str, list[TranscriptionMetadata]] = {}
-
-        for trans in transcriptions:
-            # Generate a conversation ID
-            # TODO: Implement proper grouping based on Superwhisper's re-transcription logic
-            # For now, each transcription is its own conversation
-            conv_id = self._generate_conversation_id(trans)
-
-            if conv_id not in conversation_groups:
-                conversation_groups[conv_id] = []
-
-            conversation_groups[conv_id].append(trans)
-
-        # Convert groups to Conversation objects
-        conversations: list[Conversation] = []
-        for conv_id, trans_list in conversation_groups.items():
-            # Sort by timestamp
-            trans_list.sort(key=lambda x: x.timestamp, reverse=True)
-
-            # Create versions
-            versions: list[AudioVersion] = []
-            for idx, trans in enumerate(trans_list):
-                is_latest = idx == 0
-                version = AudioVersion(
-                    version_id=str(trans.timestamp),
-                    timestamp=trans.timestamp,
-                    transcription=trans,
-                    is_latest=is_latest,
-                )
-                versions.append(version)
-
-            # Create conversation
-            latest_version = versions[0] if versions else None
-            title = self._generate_conversation_title(trans_list[0])
-
-            conversation = Conversation(
-                conversation_id=conv_id,
-                title=title,
-                versions=versions,
-                latest_version=latest_version,
-                created_at=trans_list[-1].created_at if trans_list else None,
-                updated_at=trans_list[0].created_at if trans_list else None,
-            )
-            conversations.append(conversation)
-
-        # Sort conversations by most recent update
-        conversations.sort(
-            key=lambda x: x.updated_at or datetime.min,
-            reverse=True,
-        )
-
-        return conversations
-
-    def _generate_conversation_id(self, transcription: TranscriptionMetadata) -> str:
-        """
-        Generate a unique conversation ID.
-
-        Uses audio hash to group re-processed versions of the same recording.
-        If audio hash is not available, falls back to timestamp.
-
-        Args:
-            transcription: Transcription metadata
-
-        Returns:
-            Conversation ID
-        """
-        # Use audio hash as conversation ID to group versions
-        if transcription.audio_hash:
-            return transcription.audio_hash
-
-        # Fallback to timestamp if no audio hash available
-        # This means each transcription is its own conversation
-        return str(transcription.timestamp)
+        self.repository.cache_audio_file_path(conversation_id, version_id, transcription.audio_file)
+        return str(transcription.audio_file)
 
-    def _generate_conversation_title(self, transcription: TranscriptionMetadata) -> str:
+    async def _get_version_transcription(
+        self, conversation_id: str, version_id: str
+    ) -> TranscriptionMetadata:
         """
-        Generate a title for the conversation.
+        Get the transcription of a specific conversation version.
 
-        Prefers LLM output over raw transcription.
+        Version IDs are recording timestamps, so the version is loaded on its
+        own and kept if it maps to the requested conversation ID. Only when
+        that fails (e.g. the conversation is addressed by a recording ID) is
+        the whole conversation loaded and searched.
 
         Args:
-            transcription: Transcription metadata
+            conversation_id: Conversation identifier
+            version_id: Version identifier (timestamp)
 
         Returns:
-            Conversation title
-        """
-        # Try to extract title from transcription
-        # Prefer llm > raw > preprocessed > legacy field
-        text = (
-            transcription.llm_transcription
-            or transcription.raw_transcription
-            or transcription.preprocessed_transcription
-            or transcription.transcription_text
-        )
-
-        if text:
-            # Use first 50 characters of transcription
-            text = text.strip()
-            if len(text) > 50:
-                return text[:50] + "..."
-            return text
-
-        # Fallback to timestamp-based title
-        if transcription.created_at:
-            return transcription.created_at.strftime("Conversation on %Y-%m-%d %H:%M:%S")
-
-        return f"Conversation {transcription.timestamp}"
+            Transcription metadata of the version
 
-    def _extract_match_contexts(
-        self, text: str, query: str, context_chars: int = 100
-    ) -> list[str]:
+        Raises:
+            FileNotFoundError: If conversation or version not found
         """
-        Extract context around query matches in text.
+        if is_timestamp_name(version_id):
+            transcription = await self.repository.get_transcription_by_timestamp(int(version_id))
+            if transcription and transcription.conversation_key == conversation_id:
+                return transcription
 
-        Args:
-            text: Text to search
-            query: Query string
-            context_chars: Number of characters to include before and after match
+        conversation = await self.get_conversation_by_id(conversation_id)
+        if not conversation:
+            raise FileNotFoundError(f"Conversation {conversation_id} not found")
 
-        Returns:
-            List of text snippets with context around matches
-        """
-        contexts: list[str] = []
-        text_lower = text.lower()
-        query_lower = query.lower()
-
-        start = 0
-        while True:
-            pos = text_lower.find(query_lower, start)
-            if pos == -1:
+        # Find the specific version
+        version = None
+        for v in conversation.versions:
+            if v.version_id == version_id:
+                version = v
                 break
 
-            # Extract context
-            context_start = max(0, pos - context_chars)
-            context_end = min(len(text), pos + len(query) + context_chars)
-
-            context = text[context_start:context_end]
-
-            # Add ellipsis if needed
-            if context_start > 0:
-                context = "..." + context
-            if context_end < len(text):
-                context = context + "..."
-
-            contexts.append(context)
-            start = pos + len(query)
-
-            # Limit to 5 matches per text
-            if len(contexts) >= 5:
-                break
+        if not version:
+            raise FileNotFoundError(
+                f"Version {version_id} not found in conversation {conversation_id}"
+            )
 
-        return contexts
+        return version.transcription
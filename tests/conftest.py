@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app.db import database
+from app.repositories import transcription_index
+from tests.factories import write_recording
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the shared SQLite connection at a fresh, initialized database."""
+    db_path = tmp_path / "test.db"
+    database.close_db()
+    monkeypatch.setattr(database, "DB_PATH", db_path)
+    database.init_db()
+    transcription_index._count_cache.invalidate()
+
+    yield db_path
+
+    database.close_db()
+    transcription_index._count_cache.invalidate()
+
+
+@pytest.fixture
+def archive(db: Path, tmp_path: Path) -> Path:
+    """Create a Superwhisper archive with one recording transcribed twice."""
+    base = tmp_path / "recordings"
+    base.mkdir()
+    write_recording(
+        base,
+        1700000000,
+        {
+            "rawResult": "first attempt",
+            "datetime": "2023-11-14T22:13:20",
+            "segments": [{"start": 0.0, "end": 1.5, "text": "first attempt"}],
+        },
+    )
+    write_recording(
+        base,
+        1700000100,
+        {"rawResult": "second attempt", "datetime": "2023-11-14T22:15:00"},
+    )
+    return base
@@ -0,0 +1,44 @@
+"""Helpers building test data: Superwhisper archives and search index rows."""
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+from app.models.transcription import TranscriptionMetadata
+
+# Audio shared by the recordings of the archive fixture, so they form one conversation
+ARCHIVE_AUDIO = b"RIFF fake wav data"
+
+# Conversation of the archive fixture, keyed by the hash of its audio
+ARCHIVE_CONVERSATION_ID = hashlib.sha256(ARCHIVE_AUDIO).hexdigest()
+
+
+def write_recording(
+    base: Path, timestamp: int, metadata: dict, audio: bytes = ARCHIVE_AUDIO
+) -> Path:
+    """Write a Superwhisper recording directory and return its meta.json path."""
+    directory = base / str(timestamp)
+    directory.mkdir(exist_ok=True)
+    (directory / "output.wav").write_bytes(audio)
+    metadata_file = directory / "meta.json"
+    metadata_file.write_bytes(orjson.dumps(metadata))
+    return metadata_file
+
+
+def make_index_row(
+    conversation_id: str,
+    timestamp: int,
+    text: str,
+    is_latest: bool = True,
+    created_at: datetime | None = None,
+) -> tuple[str, str, int, TranscriptionMetadata, str, bool]:
+    """Build a TranscriptionIndexRepo.upsert_many row for a transcription with the given text."""
+    transcription = TranscriptionMetadata(
+        timestamp=timestamp,
+        directory=Path(f"/fake/{timestamp}"),
+        raw_transcription=text,
+        created_at=created_at or datetime.fromtimestamp(timestamp),
+    )
+    return (conversation_id, str(timestamp), timestamp, transcription, text[:20], is_latest)
@@ -1,5 +1,7 @@
 """Tests for API endpoints."""
 
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -7,12 +9,38 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.dependencies import get_transcription_service
 from app.main import app
 from app.models.transcription import AudioVersion, Conversation, TranscriptionMetadata
+from app.repositories.superwhisper import SuperwhisperRepository
+from app.repositories.transcription_index import TranscriptionIndexRepo
+from app.services import transcription_service
+from app.services.transcription_service import TranscriptionService
+from tests.factories import ARCHIVE_CONVERSATION_ID, make_index_row, write_recording
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def archive_client(archive: Path) -> Iterator[TestClient]:
+    """Serve the archive fixture through the API."""
+    service = TranscriptionService(SuperwhisperRepository(archive))
+    # Scanning fills the recording cache that conversation lookups use
+    asyncio.run(service.get_all_conversations())
+    app.dependency_overrides[get_transcription_service] = lambda: service
+    yield client
+    app.dependency_overrides.pop(get_transcription_service)
+
+
+@pytest.fixture
+def index_client(db: Path) -> Iterator[TestClient]:
+    """Serve conversations from the search index only."""
+    service = TranscriptionService(SuperwhisperRepository(Path("/nonexistent")))
+    app.dependency_overrides[get_transcription_service] = lambda: service
+    yield client
+    app.dependency_overrides.pop(get_transcription_service)
+
+
 @pytest.fixture
 def mock_service() -> AsyncMock:
     """Create a mock transcription service."""
@@ -45,7 +73,6 @@ def mock_service() -> AsyncMock:
 
     service.get_all_conversations.return_value = [conversation]
     service.get_conversation_by_id.return_value = conversation
-    service.search_conversations.return_value = [(conversation, ["Test match"])]
     service.get_audio_file.return_value = b"fake audio data"
 
     return service
@@ -112,3 +139,118 @@ def test_get_audio_file(mock_service: AsyncMock) -> None:
         assert response.status_code == 200
         assert response.headers["content-type"] == "audio/wav"
         assert response.content == b"fake audio data"
+
+
+def test_get_conversation_loads_segments(archive_client: TestClient) -> None:
+    """Timecodes are read from meta.json for the versions that have them."""
+    response = archive_client.get(f"/api/v1/conversations/{ARCHIVE_CONVERSATION_ID}")
+
+    assert response.status_code == 200
+    versions = {
+        v["version_id"]: v["transcription"]["transcription_with_timecodes"]
+        for v in response.json()["versions"]
+    }
+    assert versions == {
+        "1700000100": [],
+        "1700000000": [{"start_time": 0.0, "end_time": 1.5, "text": "first attempt"}],
+    }
+
+
+def test_get_audio_file_rejects_non_timestamp_versions(archive_client: TestClient) -> None:
+    """Version IDs that only look numeric are not found instead of failing int()."""
+    response = archive_client.get(f"/api/v1/conversations/{ARCHIVE_CONVERSATION_ID}/audio/²")
+    assert response.status_code == 404
+
+    response = archive_client.get(
+        f"/api/v1/conversations/{ARCHIVE_CONVERSATION_ID}/audio/1700000000"
+    )
+    assert response.status_code == 200
+
+
+def test_get_conversation_not_modified(
+    archive_client: TestClient, archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Conditional requests get 304 until the conversation's content changes."""
+    url = f"/api/v1/conversations/{ARCHIVE_CONVERSATION_ID}"
+    etag = archive_client.get(url).headers["ETag"]
+
+    response = archive_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Re-processing a recording in place keeps its version count and timestamps
+    monkeypatch.setattr(transcription_service, "CONVERSATION_CACHE_TTL", 0)
+    write_recording(
+        archive,
+        1700000100,
+        {"rawResult": "re-processed in place", "datetime": "2023-11-14T22:15:00"},
+    )
+
+    response = archive_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["versions"][0]["transcription"]["raw_transcription"] == (
+        "re-processed in place"
+    )
+
+
+def list_with_cursor(index_client: TestClient, cursor: str | None) -> dict:
+    """Fetch one page of the conversation list, two items per page."""
+    params = {"page_size": 2} | ({"cursor": cursor} if cursor else {})
+    response = index_client.get("/api/v1/conversations", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_list_conversations_cursor_pagination(index_client: TestClient) -> None:
+    """Cursor pages report neighbours consistently with their cursors."""
+    TranscriptionIndexRepo().upsert_many(
+        [make_index_row(f"conv-{i}", 1700000000 + i, f"text {i}") for i in range(5)]
+    )
+
+    first = list_with_cursor(index_client, None)
+    assert [item["conversation_id"] for item in first["items"]] == ["conv-4", "conv-3"]
+    assert first["pagination"]["has_prev"] is False
+    assert first["pagination"]["has_next"] is True
+
+    second = list_with_cursor(index_client, first["pagination"]["next_cursor"])
+    assert [item["conversation_id"] for item in second["items"]] == ["conv-2", "conv-1"]
+    assert second["pagination"]["has_prev"] is True
+    assert second["pagination"]["has_next"] is True
+
+    last = list_with_cursor(index_client, second["pagination"]["next_cursor"])
+    assert [item["conversation_id"] for item in last["items"]] == ["conv-0"]
+    assert last["pagination"]["has_prev"] is True
+    assert last["pagination"]["has_next"] is False
+    assert last["pagination"]["next_cursor"] is None
+
+
+def test_list_conversations_exact_last_page_has_no_cursor(index_client: TestClient) -> None:
+    """A full last page does not point at an empty next page."""
+    TranscriptionIndexRepo().upsert_many(
+        [make_index_row(f"conv-{i}", 1700000000 + i, f"text {i}") for i in range(4)]
+    )
+
+    first = list_with_cursor(index_client, None)
+    last = list_with_cursor(index_client, first["pagination"]["next_cursor"])
+
+    assert len(last["items"]) == 2
+    assert last["pagination"]["next_cursor"] is None
+    assert last["pagination"]["has_next"] is False
+
+
+def test_search_conversations_reports_version_counts(index_client: TestClient) -> None:
+    """Search results count every version of a conversation, not just the match."""
+    TranscriptionIndexRepo().upsert_many(
+        [
+            make_index_row("conv-1", 1700000000, "draft wording", is_latest=False),
+            make_index_row("conv-1", 1700000100, "final wording"),
+            make_index_row("conv-2", 1700000200, "final answer"),
+        ]
+    )
+
+    response = index_client.get("/api/v1/conversations/search", params={"q": "final"})
+
+    assert response.status_code == 200
+    counts = {item["conversation_id"]: item["version_count"] for item in response.json()["items"]}
+    assert counts == {"conv-1": 2, "conv-2": 1}
@@ -0,0 +1,66 @@
+"""Tests for the SQLite connection and schema helpers."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.db import clear_index, close_db, get_db, init_db
+from app.repositories.transcription_index import TranscriptionIndexRepo
+from tests.factories import make_index_row
+
+
+def test_get_db_raises_after_close_until_init(db: Path) -> None:
+    """A closed connection is only reopened by init_db, never implicitly."""
+    close_db()
+
+    with pytest.raises(RuntimeError):
+        get_db()
+
+    init_db()
+    assert get_db().execute("SELECT COUNT(*) FROM transcription_index").fetchone()[0] == 0
+
+
+def test_created_at_round_trips_through_the_index(db: Path) -> None:
+    """Integer and legacy ISO created_at values both decode to datetimes."""
+    repo = TranscriptionIndexRepo()
+    moon_landing = datetime(1969, 7, 20, 20, 17, 40, 123456)
+    with_micros = datetime(2023, 11, 14, 22, 13, 20, 999999)
+    repo.upsert_many(
+        [
+            make_index_row("pre-epoch", 1700000000, "pre-epoch", created_at=moon_landing),
+            make_index_row("micros", 1700000001, "micros", created_at=with_micros),
+            make_index_row("legacy", 1700000002, "legacy"),
+        ]
+    )
+    # Rows indexed before the integer encoding hold ISO 8601 strings
+    get_db().execute(
+        "UPDATE transcription_index SET created_at = '2023-01-02T03:04:05.678901' "
+        "WHERE conversation_id = 'legacy'"
+    )
+
+    rows, _ = repo.get_paginated_conversations(page_size=10)
+
+    created = {row["conversation_id"]: row["created_at"] for row in rows}
+    assert created == {
+        # Sub-second precision is truncated, including before the epoch
+        "pre-epoch": datetime(1969, 7, 20, 20, 17, 40),
+        "micros": datetime(2023, 11, 14, 22, 13, 20),
+        "legacy": datetime(2023, 1, 2, 3, 4, 5, 678901),
+    }
+
+
+def test_clear_index_keeps_fts_in_sync(db: Path) -> None:
+    """After a clear, old postings are gone and new rows are indexed by the triggers."""
+    repo = TranscriptionIndexRepo()
+    repo.upsert_many([make_index_row("old", 1700000000, "cleared words")])
+
+    clear_index()
+    repo.upsert_many([make_index_row("new", 1700000001, "fresh words")])
+
+    assert repo.search("cleared")[1] == 0
+    hits, total = repo.search("words")
+    assert total == 1
+    assert hits[0].conversation_id == "new"
+    # Raises if the FTS index still holds entries for the cleared rows
+    get_db().execute("INSERT INTO transcription_fts(transcription_fts) VALUES ('integrity-check')")
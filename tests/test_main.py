@@ -1,9 +1,18 @@
 """Tests for main application."""
 
+import asyncio
+import threading
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app import main
+from app.api import dependencies
+from app.db import database
 from app.main import app
+from app.models.transcription import TranscriptionMetadata
+from app.repositories.base import TranscriptionRepository
 
 client = TestClient(app)
 
@@ -55,3 +64,48 @@ def test_docs_available() -> None:
 
     response = client.get("/openapi.json")
     assert response.status_code == 200
+
+
+class BlockingRepository(TranscriptionRepository):
+    """Repository whose scan blocks until it is cancelled."""
+
+    def __init__(self, base_directory: Path) -> None:
+        super().__init__(base_directory)
+        self.scan_started = threading.Event()
+        self.scan_cancelled = threading.Event()
+
+    async def get_all_transcriptions(self) -> list[TranscriptionMetadata]:
+        self.scan_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.scan_cancelled.set()
+            raise
+        return []
+
+    async def get_transcription_by_recording_id(
+        self, recording_id: str
+    ) -> TranscriptionMetadata | None:
+        return None
+
+    async def get_transcription_by_timestamp(self, timestamp: int) -> TranscriptionMetadata | None:
+        return None
+
+    async def read_audio_file(self, transcription: TranscriptionMetadata) -> bytes:
+        return b""
+
+
+def test_shutdown_stops_running_sync(db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shutting down mid-sync cancels the sync before the database is closed."""
+    repo = BlockingRepository(db.parent)
+    monkeypatch.setattr(main, "get_superwhisper_repository", lambda: repo)
+    monkeypatch.setattr(dependencies, "_indexing_service", None)
+    monkeypatch.setattr(main, "indexing_service", None)
+
+    with TestClient(app):
+        assert repo.scan_started.wait(timeout=5)
+        sync_task = main.indexing_service._sync_task
+
+    assert repo.scan_cancelled.is_set()
+    assert sync_task.done()
+    assert database._connection is None
@@ -0,0 +1,103 @@
+"""Tests for the Superwhisper repository."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from app.db import transaction
+from app.repositories import superwhisper
+from app.repositories.superwhisper import SuperwhisperRepository
+from tests.factories import ARCHIVE_CONVERSATION_ID, write_recording
+
+
+async def test_unchanged_transcription_is_reused(archive: Path) -> None:
+    """Loading an unchanged recording again returns the cached transcription."""
+    repo = SuperwhisperRepository(archive)
+
+    first = await repo.get_transcription_by_timestamp(1700000000)
+    second = await repo.get_transcription_by_timestamp(1700000000)
+
+    assert first is not None
+    assert second is first
+
+
+async def test_changed_transcription_is_reloaded(archive: Path) -> None:
+    """Rewriting meta.json invalidates the cached transcription."""
+    repo = SuperwhisperRepository(archive)
+    first = await repo.get_transcription_by_timestamp(1700000000)
+
+    write_recording(archive, 1700000000, {"rawResult": "re-processed in place"})
+    second = await repo.get_transcription_by_timestamp(1700000000)
+
+    assert second is not first
+    assert second is not None
+    assert second.raw_transcription == "re-processed in place"
+
+
+async def test_scan_restores_cleared_cache_rows(archive: Path) -> None:
+    """Rescans write cache rows back even for transcriptions reused from memory."""
+    repo = SuperwhisperRepository(archive)
+    await repo.get_all_transcriptions()
+
+    with transaction() as cursor:
+        cursor.execute("DELETE FROM superwhisper_cache")
+    # A new recording changes the base directory, so the next call rescans
+    write_recording(archive, 1700000200, {"rawResult": "third attempt"})
+    await repo.get_all_transcriptions()
+
+    assert repo._cache.get_by_internal_id("1700000000") is not None
+    assert repo._cache.get_by_internal_id("1700000200") is not None
+
+
+async def test_audio_hash_is_reused_while_file_is_unchanged(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Audio files are only re-hashed when their size or mtime changes."""
+    hashed: list[Path] = []
+    hash_file = superwhisper._hash_file
+
+    def counting_hash_file(path: Path) -> str:
+        hashed.append(path)
+        return hash_file(path)
+
+    monkeypatch.setattr(superwhisper, "_hash_file", counting_hash_file)
+
+    # Fresh repositories share only the database, not the in-memory entry cache
+    first = await SuperwhisperRepository(archive).get_transcription_by_timestamp(1700000000)
+    second = await SuperwhisperRepository(archive).get_transcription_by_timestamp(1700000000)
+    assert len(hashed) == 1
+    assert first is not None and second is not None
+    assert second.audio_hash == first.audio_hash == ARCHIVE_CONVERSATION_ID
+
+    (archive / "1700000000" / "output.wav").write_bytes(b"different audio")
+    third = await SuperwhisperRepository(archive).get_transcription_by_timestamp(1700000000)
+    assert len(hashed) == 2
+    assert third is not None
+    assert third.audio_hash == hashlib.sha256(b"different audio").hexdigest()
+
+
+async def test_unknown_recording_id_is_negatively_cached(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unknown recording IDs are not rescanned until a recording is added."""
+    repo = SuperwhisperRepository(archive)
+    scans = 0
+    get_all_transcriptions = repo.get_all_transcriptions
+
+    async def counting_get_all_transcriptions() -> list:
+        nonlocal scans
+        scans += 1
+        return await get_all_transcriptions()
+
+    monkeypatch.setattr(repo, "get_all_transcriptions", counting_get_all_transcriptions)
+
+    assert await repo.get_transcription_by_recording_id("rec-new") is None
+    assert await repo.get_transcription_by_recording_id("rec-new") is None
+    assert scans == 1
+
+    write_recording(archive, 1700000200, {"recordingId": "rec-new", "rawResult": "late"})
+    found = await repo.get_transcription_by_recording_id("rec-new")
+    assert scans == 2
+    assert found is not None
+    assert found.timestamp == 1700000200
@@ -0,0 +1,175 @@
+"""Tests for the transcription search index repository."""
+
+from pathlib import Path
+
+from app.db import close_db, get_db, init_db, suspend_fts_sync
+from app.repositories.transcription_index import (
+    ID_BATCH_SIZE,
+    UPSERT_BATCH_SIZE,
+    TranscriptionIndexRepo,
+    _CountCache,
+    _to_fts_query,
+)
+from tests.factories import make_index_row
+
+
+def latest_versions() -> dict[str, str]:
+    """Map each conversation in the index to its version flagged as latest."""
+    rows = get_db().execute(
+        "SELECT conversation_id, version_id FROM transcription_index WHERE is_latest = 1"
+    )
+    return {row["conversation_id"]: row["version_id"] for row in rows}
+
+
+def test_init_db_rebuilds_fts_after_interrupted_bulk_load(db: Path) -> None:
+    """Rows written while FTS sync was suspended become searchable on restart."""
+    repo = TranscriptionIndexRepo()
+
+    suspend_fts_sync()
+    repo.upsert_many([make_index_row("conv-1", 1700000000, "interrupted bulk load")])
+    # The process dies here, before rebuild_fts() runs
+    close_db()
+
+    init_db()
+
+    results, total = repo.search("interrupted")
+    assert total == 1
+    assert results[0].conversation_id == "conv-1"
+
+    # The sync triggers are back, so later writes are indexed incrementally
+    repo.upsert_many([make_index_row("conv-2", 1700000001, "incremental write")])
+    assert repo.search("incremental")[1] == 1
+
+
+def test_upsert_many_writes_every_batch(db: Path) -> None:
+    """Rows spanning several multi-row statements are all inserted and searchable."""
+    repo = TranscriptionIndexRepo()
+    rows = [
+        make_index_row(f"conv-{i}", 1700000000 + i, f"batch row {i}")
+        for i in range(UPSERT_BATCH_SIZE * 2 + 5)
+    ]
+
+    repo.upsert_many(rows)
+
+    assert repo.get_count() == len(rows)
+    assert repo.search("batch", page_size=100)[1] == len(rows)
+
+
+def test_upsert_many_skips_unchanged_rows(db: Path) -> None:
+    """Re-upserting identical rows writes nothing; changed rows are re-indexed."""
+    repo = TranscriptionIndexRepo()
+    rows = [make_index_row(f"conv-{i}", 1700000000 + i, f"original {i}") for i in range(3)]
+    repo.upsert_many(rows)
+
+    conn = get_db()
+    changes = conn.total_changes
+    repo.upsert_many(rows)
+    assert conn.total_changes == changes
+
+    repo.upsert_many([make_index_row("conv-1", 1700000001, "rewritten text")])
+    assert repo.search("rewritten")[1] == 1
+    hits, _ = repo.search("original")
+    assert sorted(hit.conversation_id for hit in hits) == ["conv-0", "conv-2"]
+
+
+def test_upsert_many_refreshes_latest_flags(db: Path) -> None:
+    """refresh_latest marks only the newest version of each conversation."""
+    repo = TranscriptionIndexRepo()
+    repo.upsert_many(
+        [
+            make_index_row("conv", 1700000000, "old", is_latest=False),
+            make_index_row("conv", 1700000100, "new", is_latest=False),
+        ],
+        refresh_latest=True,
+    )
+    assert latest_versions() == {"conv": "1700000100"}
+
+    repo.upsert_many(
+        [make_index_row("conv", 1700000200, "newer", is_latest=False)], refresh_latest=True
+    )
+    assert latest_versions() == {"conv": "1700000200"}
+
+
+def test_delete_many_spans_several_batches_and_keeps_fts_in_sync(db: Path) -> None:
+    """Deleting more than ID_BATCH_SIZE conversations also removes them from search."""
+    repo = TranscriptionIndexRepo()
+    doomed = [f"doomed-{i}" for i in range(ID_BATCH_SIZE + 5)]
+    repo.upsert_many(
+        [make_index_row(cid, 1700000000 + i, f"doomed row {i}") for i, cid in enumerate(doomed)]
+        + [make_index_row("kept", 1600000000, "kept row")]
+    )
+
+    repo.delete_many(doomed)
+
+    assert repo.get_count() == 1
+    assert repo.search("doomed")[1] == 0
+    hits, total = repo.search("row")
+    assert total == 1
+    assert hits[0].conversation_id == "kept"
+    # Raises if the FTS index still holds entries for deleted rows
+    get_db().execute("INSERT INTO transcription_fts(transcription_fts) VALUES ('integrity-check')")
+
+
+def test_counts_are_cached_until_the_index_changes(db: Path) -> None:
+    """Cached counts are reused between writes and dropped by every write."""
+    repo = TranscriptionIndexRepo()
+    repo.upsert_many([make_index_row("conv-1", 1700000000, "counted text")])
+    assert repo.get_count() == 1
+    assert repo.search("counted")[1] == 1
+
+    # A write outside the repository is not seen while the counts are cached
+    get_db().execute("DELETE FROM transcription_index")
+    assert repo.get_count() == 1
+
+    # Repository writes drop the stale counts
+    repo.upsert_many(
+        [
+            make_index_row("conv-2", 1700000001, "counted again"),
+            make_index_row("conv-3", 1700000002, "counted once more"),
+        ]
+    )
+    assert repo.get_count() == 2
+    assert repo.search("counted")[1] == 2
+
+
+def test_count_cache_discards_counts_from_before_an_invalidation() -> None:
+    """A count computed while a write invalidated the cache is not stored."""
+    cache = _CountCache()
+    generation = cache.generation
+
+    cache.invalidate()
+    cache.store(("all",), 5, generation)
+    assert cache.get(("all",)) is None
+
+    cache.store(("all",), 6, cache.generation)
+    assert cache.get(("all",)) == 6
+
+
+def test_to_fts_query_ors_quoted_terms_in_both_columns() -> None:
+    """Terms are quoted literally, OR-ed and limited to title and raw_transcription."""
+    assert _to_fts_query("hello world") == '{title raw_transcription}: ("hello" OR "world")'
+    assert _to_fts_query('say "NOT" now') == (
+        '{title raw_transcription}: ("say" OR """NOT""" OR "now")'
+    )
+    assert _to_fts_query("   ") == '{title raw_transcription}: ("")'
+
+
+def test_search_matches_any_term(db: Path) -> None:
+    """A multi-term search finds versions containing any of the terms."""
+    repo = TranscriptionIndexRepo()
+    repo.upsert_many(
+        [
+            make_index_row("conv-1", 1700000000, "apples and pears"),
+            make_index_row("conv-2", 1700000001, "only pears"),
+            make_index_row("conv-3", 1700000002, "nothing relevant"),
+        ]
+    )
+
+    hits, total = repo.search("apples pears")
+
+    assert total == 2
+    # Versions containing more of the terms rank first
+    assert [hit.conversation_id for hit in hits] == ["conv-1", "conv-2"]
+    assert repo.search("   ")[1] == 0
+    # FTS5 operator keywords are matched as plain words
+    assert [hit.conversation_id for hit in repo.search("AND")[0]] == ["conv-1"]
@@ -1,5 +1,6 @@
 """Tests for transcription service."""
 
+import hashlib
 from datetime import datetime
 from pathlib import Path
 
@@ -7,7 +8,10 @@ import pytest
 
 from app.models.transcription import TranscriptionMetadata
 from app.repositories.base import TranscriptionRepository
+from app.repositories.superwhisper import SuperwhisperRepository
+from app.services import transcription_service
 from app.services.transcription_service import TranscriptionService
+from tests.factories import ARCHIVE_CONVERSATION_ID, write_recording
 
 
 class MockRepository(TranscriptionRepository):
@@ -75,30 +79,6 @@ async def test_get_conversation_by_id() -> None:
     assert conversation.conversation_id == first_conv_id
 
 
-@pytest.mark.asyncio
-async def test_search_conversations() -> None:
-    """Test searching conversations."""
-    repository = MockRepository(Path("/fake"))
-    service = TranscriptionService(repository)
-
-    results = await service.search_conversations("test")
-
-    assert len(results) > 0
-    for conv, matches in results:
-        assert len(matches) > 0
-
-
-@pytest.mark.asyncio
-async def test_search_conversations_no_results() -> None:
-    """Test searching with no matching results."""
-    repository = MockRepository(Path("/fake"))
-    service = TranscriptionService(repository)
-
-    results = await service.search_conversations("nonexistent query xyz")
-
-    assert len(results) == 0
-
-
 @pytest.mark.asyncio
 async def test_get_audio_file() -> None:
     """Test getting audio file."""
@@ -114,3 +94,63 @@ async def test_get_audio_file() -> None:
     )
 
     assert audio_data == b"fake audio data"
+
+
+async def archive_service(archive: Path) -> tuple[TranscriptionService, list[int]]:
+    """Build a service over the archive, recording the timestamps it loads."""
+    repository = SuperwhisperRepository(archive)
+    service = TranscriptionService(repository)
+    # Scanning fills the recording cache that conversation lookups use
+    await service.get_all_conversations()
+
+    loaded: list[int] = []
+    load = repository.get_transcription_by_timestamp
+
+    async def counting_load(timestamp: int) -> TranscriptionMetadata | None:
+        loaded.append(timestamp)
+        return await load(timestamp)
+
+    repository.get_transcription_by_timestamp = counting_load
+    return service, loaded
+
+
+async def test_conversation_cache_evicts_least_recently_used(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Past CONVERSATION_CACHE_SIZE, the least recently used conversation is reloaded."""
+    other_audio = b"RIFF other wav data"
+    other_id = hashlib.sha256(other_audio).hexdigest()
+    write_recording(archive, 1700000200, {"rawResult": "other"}, audio=other_audio)
+    monkeypatch.setattr(transcription_service, "CONVERSATION_CACHE_SIZE", 1)
+    service, loaded = await archive_service(archive)
+
+    await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID)
+    await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID)
+    assert sorted(loaded) == [1700000000, 1700000100]
+
+    loaded.clear()
+    await service.get_conversation_by_id(other_id)
+    await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID)
+    assert sorted(loaded) == [1700000000, 1700000100, 1700000200]
+
+
+async def test_conversation_cache_is_stale_until_ttl_expires(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A meta.json rewritten in place is served from cache until the TTL runs out."""
+    service, _ = await archive_service(archive)
+    first = await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID)
+
+    write_recording(
+        archive,
+        1700000100,
+        {"rawResult": "re-processed in place", "datetime": "2023-11-14T22:15:00"},
+    )
+
+    # The base directory's mtime is unchanged, so the cached conversation is reused
+    assert await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID) is first
+
+    monkeypatch.setattr(transcription_service, "CONVERSATION_CACHE_TTL", 0)
+    refreshed = await service.get_conversation_by_id(ARCHIVE_CONVERSATION_ID)
+    assert refreshed is not first
+    assert refreshed.versions[0].transcription.raw_transcription == "re-processed in place"